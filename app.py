@@ -14,7 +14,12 @@ import secrets
 import json
 import urllib.request
 import urllib.error
+import atexit
+import logging
+import logging.handlers
+import queue
 from datetime import timedelta
+from jinja2 import FileSystemBytecodeCache
 
 DB_PATH = os.path.join(os.path.dirname(__file__), 'database.db')
 
@@ -54,6 +59,8 @@ from models.user import User
 from models.server import Server
 from utils import server_manager, settings as settings_utils
 from utils.db_schema import ensure_schema
+from utils import json_provider
+from utils.authz import get_user_permissions
 from routes import server_routes
 
 # Initialize Flask app
@@ -64,6 +71,38 @@ app.config['DATABASE'] = DB_PATH
 app.config['SECRET_KEY'] = _ensure_secret_key(DB_PATH)
 app.config['PERMANENT_SESSION_LIFETIME'] = timedelta(days=182)
 
+# Serialize API responses with orjson when it is installed
+json_provider.init_app(app)
+
+
+def _configure_route_logging():
+    """Send route error logs through a queue so stderr writes happen off the request threads"""
+    log_queue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter('%(message)s'))
+    listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    listener.start()
+    atexit.register(listener.stop)
+
+    routes_logger = logging.getLogger('routes')
+    routes_logger.setLevel(logging.INFO)
+    routes_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    routes_logger.propagate = False
+
+
+_configure_route_logging()
+
+# Templates only change through updates (which restart the app), so skip the
+# per-render mtime check and keep compiled bytecode across restarts.
+app.config['TEMPLATES_AUTO_RELOAD'] = False
+app.jinja_env.auto_reload = False
+try:
+    # No directory argument: Jinja uses its per-user, mode 0700 cache
+    # directory and refuses one owned by someone else.
+    app.jinja_env.bytecode_cache = FileSystemBytecodeCache()
+except (OSError, RuntimeError) as exc:
+    print(f"Jinja bytecode cache disabled: {exc}")
+
 # Initialize SocketIO for WebSocket support
 socketio = SocketIO(app, cors_allowed_origins="*", async_mode='threading')
 
@@ -87,6 +126,7 @@ app.register_blueprint(admin.bp)
 
 # Register console event handlers
 console.register_socketio_events(socketio)
+server_routes.init_socketio(socketio)
 
 def _get_csrf_token():
     token = session.get('_csrf_token')
@@ -103,7 +143,7 @@ def inject_globals():
     if current_user.is_authenticated:
         is_superadmin = current_user.is_superadmin
         if not is_superadmin:
-            permissions = User.get_permissions(current_user.id)
+            permissions = get_user_permissions()
         try:
             servers = Server.get_all()
             if is_superadmin or current_user.all_servers_access:
@@ -163,6 +203,14 @@ def monitor_servers():
     Background thread to monitor server statuses
     Updates database with current server statuses
     """
+    # No process survives an app restart, so a 'starting'/'stopping' claim
+    # left by an interrupted request would otherwise block the server forever.
+    try:
+        for server in Server.get_all():
+            Server.transition_status(server.id, ('starting', 'stopping'), 'offline')
+    except Exception as e:
+        print(f"Error resetting server statuses: {e}")
+
     while True:
         try:
             time.sleep(5)  # Check every 5 seconds
@@ -174,22 +222,23 @@ def monitor_servers():
                 # Check if process is running
                 is_running = server_manager.is_server_running(server.id)
 
-                # Update status if changed
-                if is_running and server.status != 'online':
-                    Server.update_status(server.id, 'online')
-                    # Broadcast status change
-                    socketio.emit('server_status_change', {
-                        'server_id': server.id,
-                        'status': 'online'
-                    })
-                elif not is_running and server.status in ('online', 'starting'):
-                    Server.update_status(server.id, 'offline')
-                    # Broadcast status change
-                    socketio.emit('server_status_change', {
-                        'server_id': server.id,
-                        'status': 'offline'
-                    })
-                    _handle_server_crash(server)
+                # Only reconcile stable states; 'starting'/'stopping' belong to
+                # the request that claimed them via transition_status
+                if is_running and server.status == 'offline':
+                    if Server.transition_status(server.id, ('offline',), 'online'):
+                        # Broadcast status change
+                        socketio.emit('server_status_change', {
+                            'server_id': server.id,
+                            'status': 'online'
+                        })
+                elif not is_running and server.status == 'online':
+                    if Server.transition_status(server.id, ('online',), 'offline'):
+                        # Broadcast status change
+                        socketio.emit('server_status_change', {
+                            'server_id': server.id,
+                            'status': 'offline'
+                        })
+                        _handle_server_crash(server)
 
         except Exception as e:
             print(f"Error in monitoring thread: {e}")
@@ -229,25 +278,30 @@ def _handle_server_crash(server):
         if webhook_url:
             _send_discord_webhook(webhook_url, message)
 
-        if settings.get('crash_auto_restart'):
-            Server.update_status(server.id, 'starting')
+        # Claim the server like a manual start, unless a user got there first
+        if settings.get('crash_auto_restart') and Server.transition_status(server.id, ('offline',), 'starting'):
             socketio.emit('server_status_change', {
                 'server_id': server.id,
                 'status': 'starting'
             })
-            ok = server_manager.start_server(
-                server.id,
-                server.port,
-                socketio=socketio,
-                java_args=server.java_args,
-                server_name=server.name
-            )
-            if not ok:
-                Server.update_status(server.id, 'offline')
-                socketio.emit('server_status_change', {
-                    'server_id': server.id,
-                    'status': 'offline'
-                })
+            ok = False
+            try:
+                ok = server_manager.start_server(
+                    server.id,
+                    server.port,
+                    socketio=socketio,
+                    java_args=server.java_args,
+                    server_name=server.name
+                )
+            finally:
+                # The monitor leaves 'starting' alone, so finish the claim
+                # here; a user stop that took over mid-start wins
+                status = 'online' if ok else 'offline'
+                if Server.transition_status(server.id, ('starting',), status):
+                    socketio.emit('server_status_change', {
+                        'server_id': server.id,
+                        'status': status
+                    })
     except Exception as exc:
         print(f"[CrashHandler] Error handling crash for server {server.id}: {exc}")
 
@@ -420,6 +474,12 @@ if __name__ == '__main__':
         browser_thread = threading.Thread(target=open_browser, daemon=True)
         browser_thread.start()
 
+    # Compile the most used template before the first request
+    try:
+        app.jinja_env.get_template('dashboard.html')
+    except Exception as exc:
+        print(f"Error pre-compiling dashboard template: {exc}")
+
     # Start Flask app with SocketIO
     print("\nStarting Hytale Server Manager...")
     print("Access the web interface at: http://localhost:5000")
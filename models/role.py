@@ -4,6 +4,7 @@ Role model for managing roles and permissions.
 
 import sqlite3
 import os
+from utils import db
 
 DB_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'database.db')
 
@@ -16,7 +17,7 @@ class Role:
 
     @staticmethod
     def get_all():
-        conn = sqlite3.connect(DB_PATH)
+        conn = db.connect(DB_PATH)
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
         cursor.execute('SELECT * FROM roles ORDER BY name')
@@ -29,7 +30,7 @@ class Role:
 
     @staticmethod
     def get_by_id(role_id):
-        conn = sqlite3.connect(DB_PATH)
+        conn = db.connect(DB_PATH)
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
         cursor.execute('SELECT * FROM roles WHERE id = ?', (role_id,))
@@ -41,7 +42,7 @@ class Role:
 
     @staticmethod
     def create(name, description=None):
-        conn = sqlite3.connect(DB_PATH)
+        conn = db.connect(DB_PATH)
         cursor = conn.cursor()
         try:
             cursor.execute(
@@ -58,7 +59,7 @@ class Role:
 
     @staticmethod
     def delete(role_id):
-        conn = sqlite3.connect(DB_PATH)
+        conn = db.connect(DB_PATH)
         cursor = conn.cursor()
         cursor.execute('DELETE FROM role_permissions WHERE role_id = ?', (role_id,))
         cursor.execute('DELETE FROM user_roles WHERE role_id = ?', (role_id,))
@@ -68,7 +69,7 @@ class Role:
 
     @staticmethod
     def set_permissions(role_id, permission_ids):
-        conn = sqlite3.connect(DB_PATH)
+        conn = db.connect(DB_PATH)
         cursor = conn.cursor()
         cursor.execute('DELETE FROM role_permissions WHERE role_id = ?', (role_id,))
         for permission_id in permission_ids:
@@ -81,7 +82,7 @@ class Role:
 
     @staticmethod
     def get_permissions(role_id):
-        conn = sqlite3.connect(DB_PATH)
+        conn = db.connect(DB_PATH)
         cursor = conn.cursor()
         cursor.execute('''
             SELECT permissions.id, permissions.key, permissions.description
@@ -95,7 +96,7 @@ class Role:
 
     @staticmethod
     def get_permission_ids(role_id):
-        conn = sqlite3.connect(DB_PATH)
+        conn = db.connect(DB_PATH)
         cursor = conn.cursor()
         cursor.execute('''
             SELECT permission_id
@@ -108,7 +109,7 @@ class Role:
 
     @staticmethod
     def get_permission_catalog():
-        conn = sqlite3.connect(DB_PATH)
+        conn = db.connect(DB_PATH)
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
         cursor.execute('SELECT * FROM permissions ORDER BY key')
@@ -5,6 +5,7 @@ Server model for server management
 import sqlite3
 import os
 from datetime import datetime
+from utils import db
 
 DB_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'database.db')
 
@@ -27,7 +28,7 @@ class Server:
     @staticmethod
     def get_all():
         """Get all servers"""
-        conn = sqlite3.connect(DB_PATH)
+        conn = db.connect(DB_PATH)
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
 
@@ -35,28 +36,85 @@ class Server:
         rows = cursor.fetchall()
         conn.close()
 
-        servers = []
-        for row in rows:
-            servers.append(Server(
-                id=row['id'],
-                name=row['name'],
-                port=row['port'],
-                status=row['status'],
-                created_at=row['created_at'],
-                last_started=row['last_started'],
-                auto_start=bool(row['auto_start']),
-                java_args=row['java_args'],
-                hytale_authenticated=bool(row['hytale_authenticated']),
-                hytale_credentials_path=row['hytale_credentials_path'],
-                server_version=row['server_version']
-            ))
+        return [Server._from_row(row) for row in rows]
+
+    @staticmethod
+    def get_id_port_pairs():
+        """Get (id, port) tuples for all servers without building Server objects"""
+        conn = db.connect(DB_PATH)
+        cursor = conn.cursor()
+
+        cursor.execute('SELECT id, port FROM servers')
+        pairs = cursor.fetchall()
+        conn.close()
 
-        return servers
+        return pairs
+
+    @staticmethod
+    def get_accessible_for(user_id, is_superadmin=False):
+        """Get all servers a user may see, resolving access in a single query"""
+        if is_superadmin:
+            return Server.get_all()
+
+        conn = db.connect(DB_PATH)
+        conn.row_factory = sqlite3.Row
+        cursor = conn.cursor()
+
+        cursor.execute('''
+            SELECT * FROM servers
+            WHERE EXISTS (SELECT 1 FROM users WHERE id = ? AND all_servers_access = 1)
+               OR id IN (SELECT server_id FROM user_server_access WHERE user_id = ?)
+            ORDER BY created_at DESC
+        ''', (user_id, user_id))
+        rows = cursor.fetchall()
+        conn.close()
+
+        return [Server._from_row(row) for row in rows]
+
+    @staticmethod
+    def get_with_access(server_id, user_id):
+        """Get a server and whether the user may access it in a single query"""
+        conn = db.connect(DB_PATH)
+        conn.row_factory = sqlite3.Row
+        cursor = conn.cursor()
+
+        cursor.execute('''
+            SELECT servers.*,
+                   (EXISTS (SELECT 1 FROM users WHERE id = ? AND all_servers_access = 1)
+                    OR EXISTS (
+                        SELECT 1 FROM user_server_access
+                        WHERE user_id = ? AND server_id = servers.id
+                    )) AS has_access
+            FROM servers
+            WHERE id = ?
+        ''', (user_id, user_id, server_id))
+        row = cursor.fetchone()
+        conn.close()
+
+        if not row:
+            return None, False
+        return Server._from_row(row), bool(row['has_access'])
+
+    @staticmethod
+    def _from_row(row):
+        return Server(
+            id=row['id'],
+            name=row['name'],
+            port=row['port'],
+            status=row['status'],
+            created_at=row['created_at'],
+            last_started=row['last_started'],
+            auto_start=bool(row['auto_start']),
+            java_args=row['java_args'],
+            hytale_authenticated=bool(row['hytale_authenticated']),
+            hytale_credentials_path=row['hytale_credentials_path'],
+            server_version=row['server_version']
+        )
 
     @staticmethod
     def get_by_id(server_id):
         """Get server by ID"""
-        conn = sqlite3.connect(DB_PATH)
+        conn = db.connect(DB_PATH)
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
 
@@ -83,7 +141,7 @@ class Server:
     @staticmethod
     def create(name, port, java_args=None):
         """Create a new server"""
-        conn = sqlite3.connect(DB_PATH)
+        conn = db.connect(DB_PATH)
         cursor = conn.cursor()
 
         try:
@@ -101,10 +159,53 @@ class Server:
             conn.close()
             return None
 
+    @staticmethod
+    def create_checked(name, port, max_servers=100, java_args=None):
+        """
+        Create a new server after checking the server limit and port in one
+        write transaction, so concurrent creates cannot both pass the checks.
+
+        Returns:
+            tuple: (server_id, None) on success, (None, 'limit' | 'port_taken' | 'error')
+        """
+        conn = sqlite3.connect(DB_PATH, isolation_level=None)
+        cursor = conn.cursor()
+
+        try:
+            cursor.execute('BEGIN IMMEDIATE')
+            cursor.execute('SELECT COUNT(*) FROM servers')
+            if cursor.fetchone()[0] >= max_servers:
+                cursor.execute('ROLLBACK')
+                return None, 'limit'
+
+            cursor.execute('SELECT 1 FROM servers WHERE port = ? LIMIT 1', (port,))
+            if cursor.fetchone():
+                cursor.execute('ROLLBACK')
+                return None, 'port_taken'
+
+            cursor.execute('''
+                INSERT INTO servers (name, port, java_args)
+                VALUES (?, ?, ?)
+            ''', (name, port, java_args))
+            server_id = cursor.lastrowid
+            cursor.execute('COMMIT')
+            return server_id, None
+        except sqlite3.IntegrityError:
+            if conn.in_transaction:
+                cursor.execute('ROLLBACK')
+            return None, 'port_taken'
+        except sqlite3.Error as e:
+            print(f"Error creating server: {e}")
+            if conn.in_transaction:
+                cursor.execute('ROLLBACK')
+            return None, 'error'
+        finally:
+            conn.close()
+
     @staticmethod
     def update_status(server_id, status):
         """Update server status"""
-        conn = sqlite3.connect(DB_PATH)
+        conn = db.connect(DB_PATH)
         cursor = conn.cursor()
 
         cursor.execute('''
@@ -116,10 +217,32 @@ class Server:
         conn.commit()
         conn.close()
 
+    @staticmethod
+    def transition_status(server_id, from_statuses, status):
+        """
+        Atomically move a server to `status` if its current status is one of
+        `from_statuses`. Returns True if the row was updated.
+        """
+        from_statuses = tuple(from_statuses)
+        placeholders = ','.join('?' for _ in from_statuses)
+        conn = db.connect(DB_PATH)
+        cursor = conn.cursor()
+
+        cursor.execute(f'''
+            UPDATE servers
+            SET status = ?, last_started = ?
+            WHERE id = ? AND status IN ({placeholders})
+        ''', (status, datetime.now().isoformat() if status == 'online' else None, server_id, *from_statuses))
+        updated = cursor.rowcount == 1
+
+        conn.commit()
+        conn.close()
+        return updated
+
     @staticmethod
     def update_authentication(server_id, authenticated, credentials_path=None):
         """Update server Hytale authentication status"""
-        conn = sqlite3.connect(DB_PATH)
+        conn = db.connect(DB_PATH)
         cursor = conn.cursor()
 
         cursor.execute('''
@@ -134,7 +257,7 @@ class Server:
     @staticmethod
     def delete(server_id):
         """Delete server"""
-        conn = sqlite3.connect(DB_PATH)
+        conn = db.connect(DB_PATH)
         cursor = conn.cursor()
 
         cursor.execute('DELETE FROM servers WHERE id = ?', (server_id,))
@@ -145,7 +268,7 @@ class Server:
     @staticmethod
     def get_count():
         """Get total number of servers"""
-        conn = sqlite3.connect(DB_PATH)
+        conn = db.connect(DB_PATH)
         cursor = conn.cursor()
 
         cursor.execute('SELECT COUNT(*) FROM servers')
@@ -157,19 +280,19 @@ class Server:
     @staticmethod
     def port_exists(port):
         """Check if port is already in use by a server"""
-        conn = sqlite3.connect(DB_PATH)
+        conn = db.connect(DB_PATH)
         cursor = conn.cursor()
 
-        cursor.execute('SELECT COUNT(*) FROM servers WHERE port = ?', (port,))
-        count = cursor.fetchone()[0]
+        cursor.execute('SELECT 1 FROM servers WHERE port = ? LIMIT 1', (port,))
+        exists = cursor.fetchone() is not None
         conn.close()
 
-        return count > 0
+        return exists
 
     @staticmethod
     def port_exists_excluding(port, server_id):
         """Check if port is already in use by another server"""
-        conn = sqlite3.connect(DB_PATH)
+        conn = db.connect(DB_PATH)
         cursor = conn.cursor()
 
         cursor.execute('SELECT COUNT(*) FROM servers WHERE port = ? AND id != ?', (port, server_id))
@@ -181,7 +304,7 @@ class Server:
     @staticmethod
     def update_port(server_id, port):
         """Update server port"""
-        conn = sqlite3.connect(DB_PATH)
+        conn = db.connect(DB_PATH)
         cursor = conn.cursor()
 
         cursor.execute('UPDATE servers SET port = ? WHERE id = ?', (port, server_id))
@@ -6,6 +6,7 @@ import sqlite3
 import os
 from flask_login import UserMixin
 from werkzeug.security import generate_password_hash, check_password_hash
+from utils import db
 
 DB_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'database.db')
 
@@ -21,7 +22,7 @@ class User(UserMixin):
     @staticmethod
     def get_by_id(user_id):
         """Get user by ID"""
-        conn = sqlite3.connect(DB_PATH)
+        conn = db.connect(DB_PATH)
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
 
@@ -43,7 +44,7 @@ class User(UserMixin):
     @staticmethod
     def get_by_username(username):
         """Get user by username"""
-        conn = sqlite3.connect(DB_PATH)
+        conn = db.connect(DB_PATH)
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
 
@@ -65,7 +66,7 @@ class User(UserMixin):
     @staticmethod
     def get_by_email(email):
         """Get user by email"""
-        conn = sqlite3.connect(DB_PATH)
+        conn = db.connect(DB_PATH)
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
 
@@ -87,7 +88,7 @@ class User(UserMixin):
     @staticmethod
     def create_user(username, email, password, is_superadmin=False, must_change_password=False, all_servers_access=False):
         """Create a new user"""
-        conn = sqlite3.connect(DB_PATH)
+        conn = db.connect(DB_PATH)
         cursor = conn.cursor()
 
         password_hash = generate_password_hash(password)
@@ -117,7 +118,7 @@ class User(UserMixin):
     @staticmethod
     def verify_password(username, password):
         """Verify user password"""
-        conn = sqlite3.connect(DB_PATH)
+        conn = db.connect(DB_PATH)
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
 
@@ -132,7 +133,7 @@ class User(UserMixin):
     @staticmethod
     def set_password(user_id, new_password, must_change_password=False):
         """Set a new password for a user."""
-        conn = sqlite3.connect(DB_PATH)
+        conn = db.connect(DB_PATH)
         cursor = conn.cursor()
         password_hash = generate_password_hash(new_password)
         cursor.execute('''
@@ -146,7 +147,7 @@ class User(UserMixin):
     @staticmethod
     def set_must_change_password(user_id, must_change_password):
         """Toggle the must_change_password flag."""
-        conn = sqlite3.connect(DB_PATH)
+        conn = db.connect(DB_PATH)
         cursor = conn.cursor()
         cursor.execute('''
             UPDATE users
@@ -159,7 +160,7 @@ class User(UserMixin):
     @staticmethod
     def set_all_servers_access(user_id, all_servers_access):
         """Toggle the all_servers_access flag."""
-        conn = sqlite3.connect(DB_PATH)
+        conn = db.connect(DB_PATH)
         cursor = conn.cursor()
         cursor.execute('''
             UPDATE users
@@ -171,7 +172,7 @@ class User(UserMixin):
 
     @staticmethod
     def has_all_servers_access(user_id):
-        conn = sqlite3.connect(DB_PATH)
+        conn = db.connect(DB_PATH)
         cursor = conn.cursor()
         cursor.execute('SELECT all_servers_access FROM users WHERE id = ?', (user_id,))
         row = cursor.fetchone()
@@ -183,7 +184,7 @@ class User(UserMixin):
     @staticmethod
     def get_roles(user_id):
         """Return role records for a user."""
-        conn = sqlite3.connect(DB_PATH)
+        conn = db.connect(DB_PATH)
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
         cursor.execute('''
@@ -200,7 +201,7 @@ class User(UserMixin):
     @staticmethod
     def set_roles(user_id, role_ids):
         """Replace user roles with the provided list."""
-        conn = sqlite3.connect(DB_PATH)
+        conn = db.connect(DB_PATH)
         cursor = conn.cursor()
         cursor.execute('DELETE FROM user_roles WHERE user_id = ?', (user_id,))
         for role_id in role_ids:
@@ -214,7 +215,7 @@ class User(UserMixin):
     @staticmethod
     def get_permissions(user_id):
         """Return a set of permission keys for a user."""
-        conn = sqlite3.connect(DB_PATH)
+        conn = db.connect(DB_PATH)
         cursor = conn.cursor()
         cursor.execute('''
             SELECT DISTINCT permissions.key
@@ -229,7 +230,7 @@ class User(UserMixin):
 
     @staticmethod
     def get_server_access_ids(user_id):
-        conn = sqlite3.connect(DB_PATH)
+        conn = db.connect(DB_PATH)
         cursor = conn.cursor()
         cursor.execute('SELECT server_id FROM user_server_access WHERE user_id = ?', (user_id,))
         server_ids = {row[0] for row in cursor.fetchall()}
@@ -238,7 +239,7 @@ class User(UserMixin):
 
     @staticmethod
     def set_server_access(user_id, server_ids):
-        conn = sqlite3.connect(DB_PATH)
+        conn = db.connect(DB_PATH)
         cursor = conn.cursor()
         cursor.execute('DELETE FROM user_server_access WHERE user_id = ?', (user_id,))
         for server_id in server_ids:
@@ -251,7 +252,7 @@ class User(UserMixin):
 
     @staticmethod
     def grant_server_access(user_id, server_id):
-        conn = sqlite3.connect(DB_PATH)
+        conn = db.connect(DB_PATH)
         cursor = conn.cursor()
         cursor.execute(
             'INSERT OR IGNORE INTO user_server_access (user_id, server_id) VALUES (?, ?)',
@@ -262,7 +263,7 @@ class User(UserMixin):
 
     @staticmethod
     def remove_server_access_for_server(server_id):
-        conn = sqlite3.connect(DB_PATH)
+        conn = db.connect(DB_PATH)
         cursor = conn.cursor()
         cursor.execute('DELETE FROM user_server_access WHERE server_id = ?', (server_id,))
         conn.commit()
@@ -272,7 +273,7 @@ class User(UserMixin):
     def has_server_access(user_id, server_id):
         if User.has_all_servers_access(user_id):
             return True
-        conn = sqlite3.connect(DB_PATH)
+        conn = db.connect(DB_PATH)
         cursor = conn.cursor()
         cursor.execute('''
             SELECT 1
@@ -287,7 +288,7 @@ class User(UserMixin):
     @staticmethod
     def has_permission(user_id, permission_key):
         """Check if a user has a permission via roles."""
-        conn = sqlite3.connect(DB_PATH)
+        conn = db.connect(DB_PATH)
         cursor = conn.cursor()
         cursor.execute('''
             SELECT 1
@@ -304,7 +305,7 @@ class User(UserMixin):
     @staticmethod
     def get_user_count():
         """Get total number of users"""
-        conn = sqlite3.connect(DB_PATH)
+        conn = db.connect(DB_PATH)
         cursor = conn.cursor()
 
         cursor.execute('SELECT COUNT(*) FROM users')
@@ -316,7 +317,7 @@ class User(UserMixin):
     @staticmethod
     def get_all():
         """Get all users."""
-        conn = sqlite3.connect(DB_PATH)
+        conn = db.connect(DB_PATH)
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
         cursor.execute('SELECT * FROM users ORDER BY created_at DESC')
@@ -338,7 +339,7 @@ class User(UserMixin):
     @staticmethod
     def delete_user(user_id):
         """Delete a user and related access rows."""
-        conn = sqlite3.connect(DB_PATH)
+        conn = db.connect(DB_PATH)
         cursor = conn.cursor()
         cursor.execute('DELETE FROM user_roles WHERE user_id = ?', (user_id,))
         cursor.execute('DELETE FROM user_server_access WHERE user_id = ?', (user_id,))
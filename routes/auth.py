@@ -9,6 +9,7 @@ import sqlite3
 import sys
 
 from models.user import User
+from utils import settings as settings_utils
 
 bp = Blueprint('auth', __name__)
 
@@ -57,6 +58,7 @@ def set_host_os(host_os):
 
         conn.commit()
         conn.close()
+        settings_utils.invalidate_host_os_cache()
         return True
     except Exception as e:
         print(f"Error setting host OS: {e}")
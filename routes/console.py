@@ -130,6 +130,30 @@ def register_socketio_events(socketio):
         except Exception as exc:
             print(f"Error joining GoTale room: {exc}")
 
+    @socketio.on('join_mods')
+    @authenticated_only
+    def handle_join_mods(data):
+        """Client joins a server's mod install progress room"""
+        try:
+            server_id = data.get('server_id')
+            if not server_id:
+                emit('error', {'message': 'Server ID required'})
+                return
+            server = Server.get_by_id(server_id)
+            if not server:
+                emit('error', {'message': 'Server not found'})
+                return
+            if not has_permission('view_servers'):
+                emit('error', {'message': 'Forbidden'})
+                return
+            if not current_user.is_superadmin and not User.has_server_access(current_user.id, server_id):
+                emit('error', {'message': 'Forbidden'})
+                return
+
+            join_room(f'mods_{server_id}')
+        except Exception as exc:
+            print(f"Error joining mods room: {exc}")
+
     @socketio.on('leave_console')
     @authenticated_only
     def handle_leave_console(data):
@@ -9,8 +9,11 @@ import subprocess
 import sys
 import os
 import threading
+import atexit
 import shutil
 import json
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 import time
@@ -20,22 +23,96 @@ from models.user import User
 from utils import port_checker, java_checker, server_manager, settings as settings_utils
 from utils.authz import require_permission
 
+try:
+    import pygit2
+except ImportError:
+    pygit2 = None
+
 bp = Blueprint('dashboard', __name__)
-_restart_in_progress = False
+_SYSTEM_DIR = Path(__file__).parent.parent
+_BASE_PATH = _SYSTEM_DIR.parent
+_SERVERS_DIR = _BASE_PATH / 'servers'
+_TEMPLATE_JAR = _BASE_PATH / 'servertemplate' / 'HytaleServer.jar'
+UPDATE_LOG_MAX_LINES = 500
+# Lines of a failed command's output reported as its error
+UPDATE_ERROR_TAIL_LINES = 10
+UPDATE_RESTART_GRACE = 10
+UPDATE_ACTIVE_PHASES = ('queued', 'checking', 'backing_up', 'pulling', 'installing', 'restarting')
+_update_log = deque(maxlen=UPDATE_LOG_MAX_LINES)
+_update_state = {
+    'phase': 'idle',
+    'mode': None,
+    'message': '',
+    'error': None,
+    'updated': False,
+    'updates': 0,
+    'started_at': None,
+    'finished_at': None
+}
+_update_lock = threading.Lock()
+_update_restart_ack = threading.Event()
+_download_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='game-download')
+_download_future = None
+_download_lock = threading.Lock()
+atexit.register(_download_executor.shutdown, wait=False)
+SERVICE_STATUS_TTL = 5
+_service_status_cache = {'checked_at': 0.0, 'value': None}
+_service_status_lock = threading.Lock()
+GAME_FILES_CACHE_TTL = 30
+_game_files_cache = {'checked_at': 0.0, 'value': False}
 
 def _get_host_os():
-    host_os = 'windows'
+    return settings_utils.get_host_os(current_app.config['DATABASE'])
+
+def _count_pending_updates_inprocess(system_dir):
+    """Fetch origin and count HEAD...origin/main commits without spawning git.
+
+    Returns None when pygit2 is unavailable or fails, so callers can fall
+    back to the git CLI.
+    """
+    if pygit2 is None:
+        return None
     try:
-        conn = sqlite3.connect(current_app.config['DATABASE'])
-        cursor = conn.cursor()
-        cursor.execute("SELECT value FROM settings WHERE key = 'host_os'")
-        result = cursor.fetchone()
-        conn.close()
-        if result and result[0]:
-            host_os = result[0]
+        repo = pygit2.Repository(str(system_dir))
+        repo.remotes['origin'].fetch()
+        local = repo.head.target
+        remote = repo.lookup_reference('refs/remotes/origin/main').target
+        ahead, behind = repo.ahead_behind(local, remote)
+        return ahead + behind
     except Exception as e:
-        print(f"Error reading host_os setting: {e}")
-    return host_os
+        print(f"In-process git check failed, falling back to git CLI: {e}")
+        return None
+
+def _probe_game_files():
+    # Check in servertemplate folder (preferred location)
+    if os.path.isfile(_TEMPLATE_JAR):
+        return True
+
+    # Check in any server directory
+    if os.path.exists(_SERVERS_DIR):
+        with os.scandir(_SERVERS_DIR) as entries:
+            for entry in entries:
+                if not entry.is_dir():
+                    continue
+                if os.path.isfile(os.path.join(entry.path, 'HytaleServer.jar')):
+                    return True
+    return False
+
+def _game_files_exist():
+    """Cached game-files probe.
+
+    Only a positive result is cached: once files exist they rarely go away,
+    while a missing result must flip as soon as a download finishes.
+    """
+    now = time.monotonic()
+    if _game_files_cache['value'] and now - _game_files_cache['checked_at'] < GAME_FILES_CACHE_TTL:
+        return True
+    exists = _probe_game_files()
+    _game_files_cache.update({'checked_at': now, 'value': exists})
+    return exists
+
+def _invalidate_game_files_cache():
+    _game_files_cache.update({'checked_at': 0.0, 'value': False})
 
 @bp.route('/dashboard')
 @login_required
@@ -44,12 +121,7 @@ def index():
     """Main dashboard page - shows server list"""
 
     # Get all servers (filtered by access when needed)
-    all_servers = Server.get_all()
-    if current_user.is_superadmin or User.has_all_servers_access(current_user.id):
-        servers = all_servers
-    else:
-        allowed_ids = User.get_server_access_ids(current_user.id)
-        servers = [server for server in all_servers if server.id in allowed_ids]
+    servers = Server.get_accessible_for(current_user.id, current_user.is_superadmin)
 
     # Get server count
     server_count = len(servers)
@@ -60,33 +132,15 @@ def index():
     java_info['download_url'] = java_checker.get_java_download_url()
 
     # Check if server files exist (in servertemplate or any server directory)
-    base_path = Path(__file__).parent.parent.parent
-
-    game_files_exist = False
-
-    # Check in servertemplate folder (preferred location)
-    template_jar = os.path.join(base_path, 'servertemplate', 'HytaleServer.jar')
-    if os.path.exists(template_jar):
-        game_files_exist = True
-
-    # Check in any server directory
-    if not game_files_exist:
-        servers_dir = os.path.join(base_path, 'servers')
-        if os.path.exists(servers_dir):
-            for server_dir in os.listdir(servers_dir):
-                server_path = os.path.join(servers_dir, server_dir)
-                if os.path.isdir(server_path):
-                    jar_path = os.path.join(server_path, 'HytaleServer.jar')
-                    if os.path.exists(jar_path):
-                        game_files_exist = True
-                        break
+    game_files_exist = _game_files_exist()
 
     host_os = _get_host_os()
     api_key = settings_utils.get_setting(current_app.config['DATABASE'], 'curseforge_api_key', '')
 
     template_version = server_manager.get_template_version()
+    server_versions = server_manager.get_server_versions_bulk([server.id for server in servers])
     for server in servers:
-        server.file_version = server_manager.get_server_version(server.id)
+        server.file_version = server_versions.get(server.id)
         server.update_available = bool(template_version and server.file_version != template_version)
 
     hytale_latest_version = settings_utils.get_setting(current_app.config['DATABASE'], 'hytale_latest_version', '')
@@ -133,9 +187,9 @@ def create_server():
         if port < 1024 or port > 65535:
             return jsonify({'success': False, 'error': 'Port must be between 1024 and 65535'}), 400
 
-        # Check server limit
-        if Server.get_count() >= 100:
-            return jsonify({'success': False, 'error': 'Maximum of 100 servers reached'}), 400
+        # Cheap indexed lookup first; only probe the socket if no server owns the port
+        if Server.port_exists(port):
+            return jsonify({'success': False, 'error': f'Port {port} is already assigned to another server'}), 400
 
         # Check if port is available
         if not port_checker.is_port_available(port):
@@ -147,13 +201,13 @@ def create_server():
                 'suggested_port': next_port
             }), 400
 
-        # Check if port is already used by another server
-        if Server.port_exists(port):
-            return jsonify({'success': False, 'error': f'Port {port} is already assigned to another server'}), 400
-
-        # Create server in database
-        server_id = Server.create(name, port)
+        # Check server limit and port assignment, then insert, in one transaction
+        server_id, create_error = Server.create_checked(name, port, max_servers=100)
 
+        if create_error == 'limit':
+            return jsonify({'success': False, 'error': 'Maximum of 100 servers reached'}), 400
+        if create_error == 'port_taken':
+            return jsonify({'success': False, 'error': f'Port {port} is already assigned to another server'}), 400
         if not server_id:
             return jsonify({'success': False, 'error': 'Failed to create server in database'}), 500
 
@@ -212,6 +266,7 @@ def delete_server(server_id):
 
         # Delete server files
         server_manager.delete_server_files(server_id)
+        _invalidate_game_files_cache()
 
         # Clear access entries
         User.remove_server_access_for_server(server_id)
@@ -258,90 +313,175 @@ def check_port(port):
         print(f"Error checking port: {e}")
         return jsonify({'available': False, 'error': 'An unexpected error occurred'}), 500
 
-@bp.route('/api/system/update', methods=['POST'])
-@login_required
-@require_permission('manage_updates')
-def update_system():
-    """Update the web interface via git and restart the app"""
-    global _restart_in_progress
-    system_dir = Path(__file__).parent.parent
+def _run_update_cmd(args, cwd, timeout=120):
+    """Run a command, streaming combined stdout/stderr into the update log"""
+    # Stream line by line into a bounded log instead of buffering the whole
+    # output (pip can be very chatty).
+    output = deque(maxlen=UPDATE_LOG_MAX_LINES)
+    try:
+        process = subprocess.Popen(
+            args,
+            cwd=cwd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1
+        )
+    except FileNotFoundError:
+        return False, '', 'command-not-found'
+    except Exception as e:
+        return False, '', str(e)
+
+    killer = threading.Timer(timeout, process.kill)
+    killer.daemon = True
+    killer.start()
+    try:
+        for line in process.stdout:
+            output.append(line)
+            _update_log.append(line)
+        process.wait()
+    except Exception as e:
+        process.kill()
+        return False, '', str(e)
+    finally:
+        killer.cancel()
+        process.stdout.close()
+
+    text = ''.join(output)
+    if process.returncode != 0:
+        # The full output is already in _update_log; keep the error short
+        tail = ''.join(list(output)[-UPDATE_ERROR_TAIL_LINES:]).strip()
+        return False, text, tail or f'exit code {process.returncode}'
+    return True, text, ''
+
+def _set_update_state(**fields):
+    with _update_lock:
+        _update_state.update(fields)
+
+def _finish_update(phase, message='', error=None, **fields):
+    _set_update_state(phase=phase, message=message, error=error, finished_at=time.time(), **fields)
+
+def _restart_web_interface(system_dir):
+    app_path = os.path.join(system_dir, 'app.py')
+    try:
+        if os.name == 'nt':
+            subprocess.Popen([sys.executable, app_path], cwd=system_dir)
+            os._exit(0)
+        else:
+            os.chdir(system_dir)
+            os.execv(sys.executable, [sys.executable, app_path])
+    except Exception as exc:
+        print(f"Restart failed: {exc}")
+        _finish_update('failed', 'Restart failed', error=str(exc))
+
+def _run_update(system_dir, mode):
+    """Background job: check for, back up, pull and install a system update"""
     root_dir = system_dir.parent
-    payload = request.get_json(silent=True) or {}
-    mode = payload.get('mode', 'update')
+    try:
+        _set_update_state(phase='checking', message='Checking for updates...')
+        update_count = _count_pending_updates_inprocess(system_dir)
+        if update_count is None:
+            ok, _, err = _run_update_cmd(['git', 'fetch', 'origin'], system_dir)
+            if not ok:
+                return _finish_update('failed', 'Update failed', error=f'Git fetch failed: {err}')
 
-    def _run_cmd(args):
-        try:
-            result = subprocess.run(
-                args,
-                cwd=system_dir,
-                check=False,
-                capture_output=True,
-                text=True,
-                timeout=120
-            )
-            return result.returncode == 0, result.stdout, result.stderr
-        except FileNotFoundError:
-            return False, '', 'command-not-found'
-        except Exception as e:
-            return False, '', str(e)
+            ok, stdout, err = _run_update_cmd(['git', 'rev-list', 'HEAD...origin/main', '--count'], system_dir)
+            if not ok:
+                return _finish_update('failed', 'Update failed', error=f'Git check failed: {err}')
 
-    ok, _, err = _run_cmd(['git', 'fetch', 'origin'])
-    if not ok:
-        return jsonify({'success': False, 'error': f'Git fetch failed: {err}'}), 500
+            try:
+                update_count = int((stdout or '0').strip())
+            except ValueError:
+                update_count = 0
 
-    ok, stdout, err = _run_cmd(['git', 'rev-list', 'HEAD...origin/main', '--count'])
-    if not ok:
-        return jsonify({'success': False, 'error': f'Git check failed: {err}'}), 500
+        if update_count == 0:
+            return _finish_update('done', 'No updates available', updated=False, updates=0)
 
-    try:
-        update_count = int((stdout or '0').strip())
-    except ValueError:
-        update_count = 0
+        if mode == 'check':
+            return _finish_update('done', f'{update_count} update(s) available', updated=False, updates=update_count)
 
-    if update_count == 0:
-        return jsonify({'success': True, 'updated': False, 'message': 'No updates available'})
+        _set_update_state(phase='backing_up', message='Backing up system files...', updates=update_count)
+        backup_dir = root_dir / 'backups'
+        backup_dir.mkdir(parents=True, exist_ok=True)
+        backup_name = f"system_backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        backup_path = backup_dir / backup_name
+        try:
+            # Source backup only: skip caches/VCS data and metadata-preserving copies
+            shutil.copytree(
+                system_dir,
+                backup_path,
+                copy_function=shutil.copyfile,
+                ignore=shutil.ignore_patterns('__pycache__', '*.pyc', '.git', 'backups')
+            )
+        except Exception as e:
+            return _finish_update('failed', 'Update failed', error=f'Backup failed: {e}')
 
-    if mode == 'check':
-        return jsonify({'success': True, 'updated': False, 'message': f'{update_count} update(s) available', 'updates': update_count})
+        _set_update_state(phase='pulling', message='Downloading update...')
+        ok, _, err = _run_update_cmd(['git', 'pull', 'origin', 'main'], system_dir)
+        if not ok:
+            return _finish_update('failed', 'Update failed', error=f'Git pull failed: {err}')
 
-    backup_dir = root_dir / 'backups'
-    backup_dir.mkdir(parents=True, exist_ok=True)
-    backup_name = f"system_backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-    backup_path = backup_dir / backup_name
-    try:
-        shutil.copytree(system_dir, backup_path)
+        _set_update_state(phase='installing', message='Installing dependencies...')
+        ok, _, err = _run_update_cmd(
+            [sys.executable, '-m', 'pip', 'install', '-r', 'requirements.txt', '--upgrade'],
+            system_dir
+        )
+        if not ok:
+            return _finish_update('failed', 'Update failed', error=f'Pip install failed: {err}')
+
+        _set_update_state(phase='restarting', message='Update installed, restarting web interface', updated=True)
+        # Restart once a status poll has delivered the 'restarting' phase to a
+        # client, or after a short grace period if nobody is watching.
+        _update_restart_ack.wait(UPDATE_RESTART_GRACE)
+        _restart_web_interface(system_dir)
     except Exception as e:
-        return jsonify({'success': False, 'error': f'Backup failed: {e}'}), 500
-
-    ok, _, err = _run_cmd(['git', 'pull', 'origin', 'main'])
-    if not ok:
-        return jsonify({'success': False, 'error': f'Git pull failed: {err}'}), 500
-
-    ok, _, err = _run_cmd([sys.executable, '-m', 'pip', 'install', '-r', 'requirements.txt', '--upgrade'])
-    if not ok:
-        return jsonify({'success': False, 'error': f'Pip install failed: {err}'}), 500
+        print(f"Error running system update: {e}")
+        _finish_update('failed', 'Update failed', error=str(e))
 
-    if _restart_in_progress:
-        return jsonify({'success': True, 'updated': True, 'message': 'Restart already in progress'})
-
-    _restart_in_progress = True
+@bp.route('/api/system/update', methods=['POST'])
+@login_required
+@require_permission('manage_updates')
+def update_system():
+    """Start a web interface update (or update check) as a background job"""
+    system_dir = _SYSTEM_DIR
+    payload = request.get_json(silent=True) or {}
+    mode = 'check' if payload.get('mode') == 'check' else 'update'
 
-    def _restart():
-        app_path = os.path.join(system_dir, 'app.py')
-        try:
-            if os.name == 'nt':
-                subprocess.Popen([sys.executable, app_path], cwd=system_dir)
-                os._exit(0)
-            else:
-                os.chdir(system_dir)
-                os.execv(sys.executable, [sys.executable, app_path])
-        except Exception as exc:
-            print(f"Restart failed: {exc}")
-            return
+    with _update_lock:
+        if _update_state['phase'] in UPDATE_ACTIVE_PHASES:
+            return jsonify({
+                'success': False,
+                'error': 'An update is already in progress',
+                'state': dict(_update_state)
+            }), 409
+        _update_state.update(
+            phase='queued',
+            mode=mode,
+            message='Queued',
+            error=None,
+            updated=False,
+            updates=0,
+            started_at=time.time(),
+            finished_at=None
+        )
+        _update_log.clear()
+        _update_restart_ack.clear()
 
-    threading.Timer(1.0, _restart).start()
+    threading.Thread(target=_run_update, args=(system_dir, mode), daemon=True).start()
+    return jsonify({'success': True, 'queued': True, 'mode': mode}), 202
 
-    return jsonify({'success': True, 'updated': True, 'message': 'Update installed, restarting web interface'})
+@bp.route('/api/system/update/status')
+@login_required
+@require_permission('manage_updates')
+def update_system_status():
+    """Poll the state of the background update job"""
+    with _update_lock:
+        state = dict(_update_state)
+    state['log'] = list(_update_log)[-50:]
+    response = jsonify({'success': True, **state})
+    if state['phase'] == 'restarting':
+        response.call_on_close(_update_restart_ack.set)
+    return response
 
 @bp.route('/api/system/health')
 def system_health():
@@ -358,30 +498,43 @@ def system_restarting():
 @require_permission('manage_servers')
 def scan_servers():
     """Scan servers folder and add missing servers to the database."""
-    base_path = Path(__file__).parent.parent.parent
-    servers_dir = base_path / 'servers'
+    servers_dir = _SERVERS_DIR
     if not servers_dir.exists():
         return jsonify({'success': False, 'error': 'Servers directory not found'}), 404
 
-    existing_servers = Server.get_all()
-    existing_ids = {server.id for server in existing_servers}
-    existing_ports = {server.port for server in existing_servers}
+    id_port_pairs = Server.get_id_port_pairs()
+    existing_ids = {server_id for server_id, _ in id_port_pairs}
+    existing_ports = {port for _, port in id_port_pairs}
 
     added = []
     skipped = 0
     errors = []
 
+    # Enumerate bound UDP ports once; fall back to per-port bind probes
+    # on platforms without /proc/net/udp.
+    bound_ports = port_checker.get_bound_udp_ports()
+
     def _pick_port(start_port=5520):
         port = start_port
         while True:
-            if port not in existing_ports and port_checker.is_port_available(port):
-                existing_ports.add(port)
-                return port
+            if port not in existing_ports:
+                if bound_ports is None:
+                    available = port_checker.is_port_available(port)
+                else:
+                    available = port not in bound_ports
+                if available:
+                    existing_ports.add(port)
+                    return port
             port += 1
 
-    for entry in sorted(os.listdir(servers_dir)):
-        if not entry.startswith('server_'):
-            continue
+    with os.scandir(servers_dir) as entries:
+        server_dirs = sorted(
+            entry.name for entry in entries
+            if entry.name.startswith('server_') and entry.is_dir()
+        )
+
+    new_rows = []
+    for entry in server_dirs:
         try:
             server_id = int(entry.split('_', 1)[1])
         except (ValueError, IndexError):
@@ -393,33 +546,50 @@ def scan_servers():
 
         config_path = servers_dir / entry / 'config.json'
         name = f'Server {server_id}'
-        if config_path.exists():
-            try:
-                with open(config_path, 'r', encoding='utf-8') as handle:
-                    payload = json.load(handle)
-                name = payload.get('ServerName') or name
-            except Exception as exc:
-                errors.append(f'Failed to read {entry}/config.json: {exc}')
+        try:
+            with open(config_path, 'rb') as handle:
+                payload = json.load(handle)
+            name = payload.get('ServerName') or name
+        except FileNotFoundError:
+            pass
+        except Exception as exc:
+            errors.append(f'Failed to read {entry}/config.json: {exc}')
+
+        new_rows.append((entry, server_id, name, _pick_port()))
+        existing_ids.add(server_id)
 
-        port = _pick_port()
+    if new_rows:
+        grant_access = not current_user.is_superadmin and not User.has_all_servers_access(current_user.id)
+        conn = sqlite3.connect(current_app.config['DATABASE'])
+        conn.execute('PRAGMA synchronous=NORMAL')
         try:
-            conn = sqlite3.connect(current_app.config['DATABASE'])
             cursor = conn.cursor()
-            cursor.execute(
-                '''
-                INSERT INTO servers (id, name, port, status)
-                VALUES (?, ?, ?, 'offline')
-                ''',
-                (server_id, name, port)
-            )
+            # One transaction (and one commit) for the whole scan
+            cursor.execute('BEGIN')
+            for entry, server_id, name, port in new_rows:
+                try:
+                    cursor.execute(
+                        '''
+                        INSERT INTO servers (id, name, port, status)
+                        VALUES (?, ?, ?, 'offline')
+                        ''',
+                        (server_id, name, port)
+                    )
+                    added.append({'id': server_id, 'name': name, 'port': port})
+                except sqlite3.Error as exc:
+                    errors.append(f'Failed to add {entry}: {exc}')
+            if grant_access and added:
+                cursor.executemany(
+                    'INSERT OR IGNORE INTO user_server_access (user_id, server_id) VALUES (?, ?)',
+                    [(current_user.id, server['id']) for server in added]
+                )
             conn.commit()
-            conn.close()
-            if not current_user.is_superadmin and not User.has_all_servers_access(current_user.id):
-                User.grant_server_access(current_user.id, server_id)
-            added.append({'id': server_id, 'name': name, 'port': port})
-            existing_ids.add(server_id)
         except Exception as exc:
-            errors.append(f'Failed to add {entry}: {exc}')
+            conn.rollback()
+            added = []
+            errors.append(f'Failed to add servers: {exc}')
+        finally:
+            conn.close()
 
     return jsonify({
         'success': True,
@@ -442,6 +612,8 @@ def get_service_status():
             'system_service': {'status': 'not-applicable'}
         })
 
+    service_name = 'hytale-server-manager.service'
+
     def _check_service(args):
         try:
             result = subprocess.run(
@@ -458,8 +630,22 @@ def get_service_status():
         except Exception:
             return 'unknown'
 
-    user_status = _check_service(['systemctl', '--user', 'is-active', 'hytale-server-manager.service'])
-    system_status = _check_service(['systemctl', 'is-active', 'hytale-server-manager.service'])
+    with _service_status_lock:
+        cached = _service_status_cache['value']
+        if cached and time.monotonic() - _service_status_cache['checked_at'] < SERVICE_STATUS_TTL:
+            user_status, system_status = cached
+        else:
+            # Both probes block on subprocesses, so run them side by side
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                user_future = executor.submit(
+                    _check_service, ['systemctl', '--user', 'is-active', service_name]
+                )
+                system_future = executor.submit(
+                    _check_service, ['systemctl', 'is-active', service_name]
+                )
+                user_status, system_status = user_future.result(), system_future.result()
+            _service_status_cache['value'] = (user_status, system_status)
+            _service_status_cache['checked_at'] = time.monotonic()
 
     return jsonify({
         'success': True,
@@ -473,17 +659,27 @@ def get_service_status():
 @require_permission('manage_downloads')
 def download_game_files_route():
     """API endpoint to download Hytale game files"""
+    global _download_future
 
     try:
-        import threading
         host_os = _get_host_os()
 
-        # Start download in background thread
-        def download_task():
-            server_manager.download_game_files(socketio=None, host_os=host_os)
-
-        thread = threading.Thread(target=download_task, daemon=True)
-        thread.start()
+        with _download_lock:
+            busy = _download_future is not None and not _download_future.done()
+            # The Hytale auto-update monitor downloads outside this executor
+            if busy or server_manager.get_download_status().get('active'):
+                return jsonify({
+                    'success': False,
+                    'already_running': True,
+                    'error': 'Download already in progress'
+                }), 409
+
+            # Single worker: a second click can never start a parallel download
+            _download_future = _download_executor.submit(
+                server_manager.download_game_files,
+                socketio=None,
+                host_os=host_os
+            )
 
         return jsonify({'success': True, 'message': 'Download started'})
 
@@ -496,8 +692,14 @@ def download_game_files_route():
 @require_permission('manage_downloads')
 def download_status_route():
     """API endpoint to get download status (polling)"""
-    status = server_manager.get_download_status()
-    return jsonify(status)
+    etag = str(server_manager.get_download_status_version())
+    if etag in request.if_none_match:
+        response = current_app.response_class(status=304)
+    else:
+        response = jsonify(server_manager.get_download_status())
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
 
 @bp.route('/api/hytale/update-check', methods=['POST'])
 @login_required
@@ -2,17 +2,26 @@
 Server control routes for start, stop, restart operations
 """
 
-from flask import Blueprint, render_template, request, jsonify, current_app
+from flask import Blueprint, render_template, request, jsonify, current_app, g, has_app_context
 from flask_login import login_required, current_user
 import os
+import codecs
 import time
 import datetime
 import traceback
+import logging
 import urllib.parse
 import urllib.request
 import json
-import sqlite3
 import hashlib
+import copy
+import atexit
+import secrets
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, wraps
 from werkzeug.utils import secure_filename
 
 from models.server import Server
@@ -24,94 +33,300 @@ from utils import gotale_config
 from utils import gotale_events
 from utils import gotale_bridge
 from utils import curseforge
+from utils import json_provider
 from utils.authz import require_permission
 
-# Import socketio from app (will be set during initialization)
+# SocketIO instance, set by app.py through init_socketio()
 _socketio = None
 
 bp = Blueprint('server', __name__)
+log = logging.getLogger(__name__)
+
+def init_socketio(socketio):
+    """Store the app's SocketIO instance for use by the routes"""
+    global _socketio
+    _socketio = socketio
 
 def get_socketio():
-    """Get the SocketIO instance from the current app"""
-    from flask import current_app
-    return getattr(current_app, 'socketio', None)
+    """Get the SocketIO instance registered at startup"""
+    return _socketio
+
+def _update_status(server_id, status):
+    """Persist a status change and push it to connected clients"""
+    Server.update_status(server_id, status)
+    _update_status_emit(server_id, status)
+
+def _update_status_emit(server_id, status):
+    socketio = get_socketio()
+    if not socketio:
+        return
+    try:
+        socketio.emit('server_status_change', {
+            'server_id': server_id,
+            'status': status
+        })
+    except Exception as exc:
+        log.warning("Error emitting status change for server %s: %s", server_id, exc)
+
+# Statuses a start/stop may begin from; 'starting'/'stopping' mean another
+# request is already working on the server. The DB status can lag the
+# process monitor, so a stop also accepts 'offline'.
+STARTABLE_STATUSES = ('offline', 'online')
+STOPPABLE_STATUSES = ('online', 'starting', 'offline')
+
+def _transition_status(server_id, from_statuses, status):
+    """Compare-and-set the status; only a successful change is broadcast"""
+    if not Server.transition_status(server_id, from_statuses, status):
+        return False
+    _update_status_emit(server_id, status)
+    return True
 
 def _get_server_or_404(server_id):
-    server = Server.get_by_id(server_id)
-    if not server:
-        return None
-    return server
+    # Memoized per request so repeated lookups don't hit the database again
+    servers = g.setdefault('_servers', {})
+    if server_id not in servers:
+        if current_user.is_superadmin:
+            servers[server_id] = Server.get_by_id(server_id)
+        else:
+            # Resolve the access check in the same query
+            server, has_access = Server.get_with_access(server_id, current_user.id)
+            servers[server_id] = server
+            g.setdefault('_server_access', {})[(current_user.id, server_id)] = has_access
+    return servers[server_id] or None
 
 def _has_server_access(server_id):
     if current_user.is_superadmin:
         return True
-    return User.has_server_access(current_user.id, server_id)
+    access = g.setdefault('_server_access', {})
+    key = (current_user.id, server_id)
+    if key not in access:
+        access[key] = User.has_server_access(current_user.id, server_id)
+    return access[key]
+
+def _require_server_access(view):
+    """Answer with a JSON 404/403 unless the server exists and the user may access it"""
+    @wraps(view)
+    def wrapped(*args, **kwargs):
+        server_id = kwargs['server_id']
+        if not _get_server_or_404(server_id):
+            return jsonify({'success': False, 'error': 'Server not found'}), 404
+        if not _has_server_access(server_id):
+            return jsonify({'success': False, 'error': 'Forbidden'}), 403
+        return view(*args, **kwargs)
+    return wrapped
 
 def _get_host_os():
-    host_os = 'windows'
-    try:
-        conn = sqlite3.connect(current_app.config['DATABASE'])
-        cursor = conn.cursor()
-        cursor.execute("SELECT value FROM settings WHERE key = 'host_os'")
-        result = cursor.fetchone()
-        conn.close()
-        if result and result[0]:
-            host_os = result[0]
-    except Exception as e:
-        print(f"Error reading host_os setting: {e}")
-    return host_os
+    return settings_utils.get_host_os(current_app.config['DATABASE'])
 
 def _read_json_file(path):
-    with open(path, 'r', encoding='utf-8') as file:
-        return json.load(file)
+    # One read of the raw bytes; the parser detects the UTF encoding itself
+    with open(path, 'rb') as file:
+        return json_provider.loads(file.read())
+
+def _read_file_payload():
+    """
+    Parse a JSON file editor POST body in one pass over the raw bytes.
+    Returns (data, error_response); a {"data": ...} envelope is unwrapped.
+    """
+    raw = request.get_data(cache=False)
+    try:
+        payload = json_provider.loads(raw) if raw else None
+    except ValueError:
+        payload = None
+    if payload is None:
+        return None, (jsonify({'success': False, 'error': 'Missing JSON payload'}), 400)
+    if isinstance(payload, dict) and 'data' in payload:
+        return payload['data'], None
+    return payload, None
+
+JSON_CACHE_MAX_ENTRIES = 256
+_json_cache = {}
+_json_cache_lock = threading.Lock()
+
+def _json_cache_get(path, st):
+    key = (st.st_mtime_ns, st.st_size)
+    with _json_cache_lock:
+        cached = _json_cache.get(path)
+    if cached and cached[0] == key:
+        return cached[1]
+    return None
+
+def _json_cache_put(path, st, data):
+    with _json_cache_lock:
+        if path not in _json_cache and len(_json_cache) >= JSON_CACHE_MAX_ENTRIES:
+            _json_cache.pop(next(iter(_json_cache)))
+        _json_cache[path] = ((st.st_mtime_ns, st.st_size), data)
+
+def _read_json_file_cached(path):
+    """
+    Parse a JSON file, reusing the previous result while its mtime and size
+    are unchanged. The returned object is shared, so callers must not modify it.
+    """
+    # fstat the open file so the cache key describes the bytes actually read,
+    # even if _write_json_file swaps in a new file meanwhile
+    with open(path, 'rb') as file:
+        st = os.fstat(file.fileno())
+        data = _json_cache_get(path, st)
+        if data is None:
+            data = json_provider.loads(file.read())
+            _json_cache_put(path, st, data)
+    return data
+
+def _json_file_response(path):
+    """
+    Serve a JSON file in the {success, data} envelope. The file's bytes are
+    embedded as-is instead of being re-encoded, and an mtime/size ETag lets
+    repeat reads come back as 304 without reading the file at all.
+    """
+    # One open file backs the ETag, the validation and the body, so a
+    # concurrent os.replace() cannot mix two versions into one response
+    with open(path, 'rb') as file:
+        st = os.fstat(file.fileno())
+        etag = f'{st.st_mtime_ns:x}-{st.st_size:x}'
+        if etag in request.if_none_match:
+            response = current_app.response_class(status=304)
+            response.set_etag(etag)
+            response.headers['Cache-Control'] = 'no-cache'
+            return response
+        raw = file.read()
+
+    # Parsing validates the file and covers non-UTF-8 encodings
+    data = _json_cache_get(path, st)
+    if data is None:
+        data = json_provider.loads(raw)
+        _json_cache_put(path, st, data)
+    if raw.startswith(codecs.BOM_UTF8):
+        raw = raw[len(codecs.BOM_UTF8):]
+    if b'\x00' in raw[:4]:
+        # UTF-16/32 files cannot be embedded in a UTF-8 body
+        response = jsonify({'success': True, 'data': data})
+    else:
+        body = b''.join((b'{"success":true,"data":', raw.strip(), b'}\n'))
+        response = current_app.response_class(body, mimetype='application/json')
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
 
 def _write_json_file(path, data):
-    with open(path, 'w', encoding='utf-8') as file:
-        json.dump(data, file, indent=2, ensure_ascii=True)
-        file.write('\n')
+    # Serialize up front so the file is written in one call, not per token.
+    # With orjson, non-ASCII text is written as UTF-8 instead of \u escapes.
+    payload = json_provider.dumps_pretty(data)
+    # Write to a temporary file and swap it in, so readers never see a
+    # partially written file and a crash cannot truncate the original.
+    temp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+    try:
+        # Keep the original file's permissions across the swap
+        mode = os.stat(path).st_mode & 0o777
+    except OSError:
+        mode = 0o644
+    try:
+        fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), mode)
+        try:
+            view = memoryview(payload)
+            while view:
+                view = view[os.write(fd, view):]
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+    finally:
+        with _json_cache_lock:
+            _json_cache.pop(path, None)
+
+CONFIG_FILE_LABELS = (
+    ('config.json', 'Main configuration (config.json)'),
+    ('permissions.json', 'Permissions (permissions.json)'),
+    ('bans.json', 'Bans (bans.json)'),
+    ('whitelist.json', 'Whitelist (whitelist.json)'),
+)
+CONFIG_FILE_NAMES = tuple(name for name, _ in CONFIG_FILE_LABELS)
+
+WORLD_CONFIG_LABEL = ('World Config (config.json)', 'Global world settings.')
+WORLD_MEMORIES_LABEL = ('Memories (memories.json)', 'Server memories and history.')
+WORLD_RESOURCE_DESCRIPTION = 'World resource file.'
+
+def _scan_json_files(directory):
+    """Return sorted (name, path) pairs for regular *.json files in a directory"""
+    try:
+        with os.scandir(directory) as entries:
+            files = [
+                (entry.name, entry.path) for entry in entries
+                if entry.name.endswith('.json') and entry.is_file()
+            ]
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+    files.sort()
+    return files
+
+FILE_MAP_CACHE_TTL = 5
+_file_map_cache = {}
+
+def _cached_file_map(kind, server_id, builder):
+    """Build a file map at most once per request and reuse it for a few seconds"""
+    key = (kind, server_id)
+    request_cache = g.setdefault('_file_map_cache', {})
+    if key in request_cache:
+        return request_cache[key].copy()
+    now = time.monotonic()
+    cached = _file_map_cache.get(key)
+    if cached and now - cached[0] < FILE_MAP_CACHE_TTL:
+        file_map = cached[1]
+    else:
+        file_map = builder(server_id)
+        _file_map_cache[key] = (now, file_map)
+    request_cache[key] = file_map
+    return file_map.copy()
 
 def _get_config_file_map(server_id):
-    base_path = server_manager.get_server_path(server_id)
-    config_files = {
-        'config.json': 'Hauptkonfiguration',
-        'permissions.json': 'Permissions',
-        'bans.json': 'Bans',
-        'whitelist.json': 'Whitelist'
-    }
-    file_map = {}
-    for name in config_files.keys():
-        path = os.path.join(base_path, name)
-        if os.path.isfile(path):
-            file_map[name] = path
-    return file_map
+    return _cached_file_map('config', server_id, _build_config_file_map)
+
+def _get_world_file_entries(server_id):
+    return _cached_file_map('world', server_id, _build_world_file_entries)
 
 def _get_world_file_map(server_id):
+    return {value: path for value, path, _, _ in _get_world_file_entries(server_id)}
+
+def _get_player_file_map(server_id):
+    return _cached_file_map('players', server_id, _build_player_file_map)
+
+def _build_config_file_map(server_id):
+    base_path = server_manager.get_server_path(server_id)
+    # One directory scan instead of an isfile() per known config file
+    present = dict(_scan_json_files(base_path))
+    return {name: present[name] for name in CONFIG_FILE_NAMES if name in present}
+
+def _build_world_file_entries(server_id):
+    """Return (value, path, label, description) tuples in display order"""
     base_path = server_manager.get_server_path(server_id)
     world_dir = os.path.join(base_path, 'universe', 'worlds', 'default')
     resources_dir = os.path.join(world_dir, 'resources')
     memories_path = os.path.join(base_path, 'universe', 'memories.json')
 
-    file_map = {}
+    entries = []
     world_config = os.path.join(world_dir, 'config.json')
     if os.path.isfile(world_config):
-        file_map['config.json'] = world_config
+        entries.append(('config.json', world_config, *WORLD_CONFIG_LABEL))
     if os.path.isfile(memories_path):
-        file_map['memories.json'] = memories_path
-    if os.path.isdir(resources_dir):
-        for filename in sorted(os.listdir(resources_dir)):
-            if filename.endswith('.json'):
-                file_map[f'resources/{filename}'] = os.path.join(resources_dir, filename)
-    return file_map
-
-def _get_player_file_map(server_id):
+        entries.append(('memories.json', memories_path, *WORLD_MEMORIES_LABEL))
+    for filename, path in _scan_json_files(resources_dir):
+        entries.append((
+            f'resources/{filename}',
+            path,
+            f'Resource: {filename}',
+            WORLD_RESOURCE_DESCRIPTION
+        ))
+    return entries
+
+def _build_player_file_map(server_id):
     base_path = server_manager.get_server_path(server_id)
     players_dir = os.path.join(base_path, 'universe', 'players')
-    file_map = {}
-    if os.path.isdir(players_dir):
-        for filename in sorted(os.listdir(players_dir)):
-            if filename.endswith('.json'):
-                file_map[filename] = os.path.join(players_dir, filename)
-    return file_map
+    return dict(_scan_json_files(players_dir))
 
 
 def _extract_player_display_name(data, fallback):
@@ -132,6 +347,7 @@ def _extract_player_display_name(data, fallback):
 
 
 MOD_MANIFEST_FILENAME = 'mods_manifest.json'
+_manifest_locks = defaultdict(threading.Lock)
 
 MOD_CLASS_LABELS = {
     6: 'Mod',
@@ -139,6 +355,14 @@ MOD_CLASS_LABELS = {
     4475: 'Modpack',
 }
 
+MOD_FILE_EXTENSIONS = ('.jar', '.zip')
+
+MOD_RELEASE_LABELS = {
+    1: 'Release',
+    2: 'Beta',
+    3: 'Alpha',
+}
+
 SORT_FIELD_MAP = {
     'popularity': 2,
     'latest': 3,
@@ -148,6 +372,29 @@ SORT_FIELD_MAP = {
 REQUIRED_RELATIONS = {3, 6}
 
 
+def _card_created_key(card):
+    return card.get('date_created') or ''
+
+
+def _file_date_key(file):
+    return file.get('fileDate') or ''
+
+# Parallel CurseForge lookups/downloads per dependency level
+MOD_INSTALL_WORKERS = 8
+
+# Independent CurseForge lookups for a single mod (e.g. mod + file metadata)
+_curseforge_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='curseforge')
+atexit.register(_curseforge_executor.shutdown, wait=False)
+
+# Background mod installs (job id -> state); finished jobs are kept for a while
+MOD_INSTALL_JOB_TTL = 3600
+_mod_install_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='mod-install')
+atexit.register(_mod_install_executor.shutdown, wait=False)
+_mod_install_jobs = {}
+_mod_install_jobs_lock = threading.Lock()
+_mod_install_server_locks = defaultdict(threading.Lock)
+
+
 def _get_mods_dir(server_id):
     return os.path.join(server_manager.get_server_path(server_id), 'mods')
 
@@ -164,17 +411,85 @@ def _load_mod_manifest(server_id):
         data = _read_json_file(path)
         if isinstance(data, dict) and isinstance(data.get('mods'), list):
             return data
-    except Exception as exc:
-        print(f"Error reading mod manifest for server {server_id}: {exc}")
+    except Exception:
+        log.exception("Error reading mod manifest for server %s", server_id)
     return {'mods': []}
 
 
+def _get_mod_manifest(server_id):
+    """Load the mod manifest once per request and share it between helpers"""
+    if not has_app_context():
+        return _load_mod_manifest(server_id)
+    manifests = g.setdefault('_mod_manifests', {})
+    if server_id not in manifests:
+        manifests[server_id] = _load_mod_manifest(server_id)
+    return manifests[server_id]
+
+
+_installed_ids_cache = {}
+
+def _installed_ids_cached(server_id):
+    """Return the CurseForge mod ids in the manifest, re-parsed only when the file changes"""
+    path = _get_mod_manifest_path(server_id)
+    try:
+        st = os.stat(path)
+    except OSError:
+        return frozenset()
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _installed_ids_cache.get(server_id)
+    if cached and cached[0] == key:
+        return cached[1]
+    manifest = _load_mod_manifest(server_id)
+    installed_ids = frozenset(
+        mod_id for item in manifest.get('mods', ())
+        if (mod_id := item.get('mod_id'))
+    )
+    _installed_ids_cache[server_id] = (key, installed_ids)
+    return installed_ids
+
+
 def _save_mod_manifest(server_id, data):
+    """Write the manifest; callers hold _manifest_locks[server_id] (see _manifest_txn)"""
     path = _get_mod_manifest_path(server_id)
     try:
         _write_json_file(path, data)
-    except Exception as exc:
-        print(f"Error writing mod manifest for server {server_id}: {exc}")
+    except Exception:
+        log.exception("Error writing mod manifest for server %s", server_id)
+    if has_app_context():
+        g.setdefault('_mod_manifests', {})[server_id] = data
+
+
+@contextmanager
+def _manifest_txn(server_id):
+    """
+    Load the manifest, let the caller modify it and save it if it changed,
+    all under the per-server lock, so concurrent mutators never lose each
+    other's updates. Keep slow work (downloads) outside the block.
+    """
+    with _manifest_locks[server_id]:
+        manifest = _load_mod_manifest(server_id)
+        before = copy.deepcopy(manifest)
+        yield manifest
+        if manifest != before:
+            _save_mod_manifest(server_id, manifest)
+
+
+def _merge_installed_entries(server_id, before, after):
+    """Apply the entries an install added or changed to the current manifest"""
+    before_by_id = {item.get('mod_id'): item for item in before.get('mods', [])}
+    changed = [item for item in after.get('mods', []) if before_by_id.get(item.get('mod_id')) != item]
+    if not changed:
+        return
+    with _manifest_txn(server_id) as manifest:
+        mods = manifest.setdefault('mods', [])
+        positions = {item.get('mod_id'): i for i, item in enumerate(mods)}
+        for item in changed:
+            i = positions.get(item.get('mod_id'))
+            if i is None:
+                positions[item.get('mod_id')] = len(mods)
+                mods.append(item)
+            else:
+                mods[i] = item
 
 
 def _iso_now():
@@ -184,9 +499,24 @@ def _iso_now():
 def _detect_side_label(game_versions):
     if not game_versions:
         return None
-    lowered = [str(item).lower() for item in game_versions]
-    has_server = any('server' in item for item in lowered)
-    has_client = any('client' in item for item in lowered)
+    try:
+        return _side_label_for(tuple(game_versions))
+    except TypeError:
+        # Unhashable entries; compute without the cache
+        return _side_label_for.__wrapped__(game_versions)
+
+
+@lru_cache(maxsize=512)
+def _side_label_for(game_versions):
+    has_server = has_client = False
+    for item in game_versions:
+        lowered = str(item).lower()
+        if not has_server and 'server' in lowered:
+            has_server = True
+        if not has_client and 'client' in lowered:
+            has_client = True
+        if has_server and has_client:
+            break
     if has_server and has_client:
         return 'Client & Server'
     if has_server:
@@ -211,7 +541,7 @@ def _is_allowed_mod_filename(filename):
     if not filename:
         return False
     lowered = filename.lower()
-    return lowered.endswith('.jar') or lowered.endswith('.zip')
+    return lowered.endswith(MOD_FILE_EXTENSIONS)
 
 
 def _select_best_file(files, server_version=None):
@@ -234,13 +564,15 @@ def _log_mod_install_error(server_id, mod_id, file_id, error_message):
         handle.write(f"[{timestamp}] server={server_id} mod={mod_id} file={file_id} error={error_message}\n")
 
 
+@lru_cache(maxsize=4096)
 def _build_forgecdn_url(file_id, file_name):
     if not file_id or not file_name:
         return None
-    try:
-        file_id = int(file_id)
-    except (TypeError, ValueError):
-        return None
+    if not isinstance(file_id, int):
+        try:
+            file_id = int(file_id)
+        except (TypeError, ValueError):
+            return None
     major = file_id // 1000
     minor = file_id % 1000
     encoded_name = urllib.parse.quote(str(file_name))
@@ -249,10 +581,11 @@ def _build_forgecdn_url(file_id, file_name):
 
 def _get_curseforge_config():
     db_path = current_app.config['DATABASE']
-    api_key = settings_utils.get_setting(db_path, 'curseforge_api_key', '').strip()
+    values = settings_utils.get_settings_cached(db_path, ('curseforge_api_key', 'curseforge_game_id'))
+    api_key = (values.get('curseforge_api_key') or '').strip()
     if not api_key:
         return None, None, 'CurseForge API key is missing.'
-    game_id = settings_utils.get_setting(db_path, 'curseforge_game_id', '70216').strip()
+    game_id = (values.get('curseforge_game_id') or '70216').strip()
     if not game_id.isdigit():
         game_id = '432'
     return api_key, int(game_id), None
@@ -284,36 +617,100 @@ def _build_mod_card(mod):
     }
 
 
-def _upsert_manifest_entry(manifest, entry):
-    mods = manifest.get('mods', [])
+def _build_manifest_index(mods):
+    """Map file names and mod ids to their first position in the manifest"""
+    index = {'by_name': {}, 'by_mod': {}}
     for idx, existing in enumerate(mods):
-        if existing.get('file_name') == entry.get('file_name'):
-            mods[idx] = entry
-            manifest['mods'] = mods
-            return
-        if entry.get('mod_id') and existing.get('mod_id') == entry.get('mod_id'):
-            mods[idx] = entry
-            manifest['mods'] = mods
-            return
-    mods.append(entry)
-    manifest['mods'] = mods
+        index['by_name'].setdefault(existing.get('file_name'), idx)
+        if existing.get('mod_id'):
+            index['by_mod'].setdefault(existing.get('mod_id'), idx)
+    return index
 
 
-def _install_mod_recursive(server_id, mod_id, file_id, api_key, server_version, manifest, visited, cache, auto_installed=False, auto_update=False):
-    key = (mod_id, file_id)
-    if key in visited:
+def _upsert_manifest_entry(manifest, entry, index=None):
+    mods = manifest.get('mods', [])
+    manifest['mods'] = mods
+    if index is None:
+        index = _build_manifest_index(mods)
+
+    matches = [index['by_name'].get(entry.get('file_name'))]
+    if entry.get('mod_id'):
+        matches.append(index['by_mod'].get(entry.get('mod_id')))
+    matches = [idx for idx in matches if idx is not None]
+
+    if matches:
+        idx = min(matches)
+        replaced = mods[idx]
+        mods[idx] = entry
+        # Keys that only the replaced entry had move to their next occurrence
+        _reindex_manifest_key(index['by_name'], mods, 'file_name', replaced.get('file_name'), idx)
+        if replaced.get('mod_id'):
+            _reindex_manifest_key(index['by_mod'], mods, 'mod_id', replaced.get('mod_id'), idx)
+    else:
+        idx = len(mods)
+        mods.append(entry)
+
+    by_name = index['by_name']
+    if by_name.get(entry.get('file_name'), idx) >= idx:
+        by_name[entry.get('file_name')] = idx
+    if entry.get('mod_id'):
+        by_mod = index['by_mod']
+        if by_mod.get(entry.get('mod_id'), idx) >= idx:
+            by_mod[entry.get('mod_id')] = idx
+
+
+def _reindex_manifest_key(lookup, mods, field, value, idx):
+    if lookup.get(value) != idx or mods[idx].get(field) == value:
         return
-    visited.add(key)
+    for next_idx in range(idx + 1, len(mods)):
+        if mods[next_idx].get(field) == value:
+            lookup[value] = next_idx
+            return
+    del lookup[value]
+
+
+def _is_complete_download(destination, expected_length):
+    """
+    Check whether a previously downloaded mod file can be reused.
+    Without a known length any existing file counts; a size mismatch
+    (e.g. a truncated download) removes the stale file.
+    """
+    try:
+        st = os.stat(destination)
+    except OSError:
+        return False
+    if not expected_length or st.st_size == expected_length:
+        return True
+    try:
+        os.remove(destination)
+    except OSError:
+        pass
+    return False
+
+
+def _new_install_cache():
+    # Per-install dedupe only; repeat lookups across installs are served by
+    # curseforge's response cache
+    return {'mods': {}, 'files': {}}
 
+
+def _fetch_mod_file(server_id, mods_dir, mod_id, file_id, api_key, cache):
+    """Load mod/file metadata and download the file (runs on a worker thread)"""
     mod_data = cache['mods'].get(mod_id)
+    mod_future = None
     if not mod_data:
-        mod_resp, error = curseforge.get_mod(api_key, mod_id)
-        if error:
-            raise RuntimeError(f"Failed to load mod {mod_id}: {error}")
+        # The mod and file lookups are independent, so run them side by side
+        mod_future = _curseforge_executor.submit(curseforge.get_mod, api_key, mod_id)
+
+    file_resp, error = curseforge.get_mod_file(api_key, mod_id, file_id)
+
+    if mod_future is not None:
+        mod_resp, mod_error = mod_future.result()
+        if mod_error:
+            raise RuntimeError(f"Failed to load mod {mod_id}: {mod_error}")
         mod_data = mod_resp.get('data')
         cache['mods'][mod_id] = mod_data
 
-    file_resp, error = curseforge.get_mod_file(api_key, mod_id, file_id)
     if error:
         raise RuntimeError(f"Failed to load file {file_id} for mod {mod_id}: {error}")
     file_data = file_resp.get('data')
@@ -341,67 +738,106 @@ def _install_mod_recursive(server_id, mod_id, file_id, api_key, server_version,
     if not download_url:
         raise RuntimeError(f"Download URL missing for {mod_id}:{file_id}")
 
-    mods_dir = _get_mods_dir(server_id)
-    os.makedirs(mods_dir, exist_ok=True)
     file_name = _sanitize_filename(file_data.get('fileName'), f"{mod_id}-{file_id}.jar")
     destination = os.path.join(mods_dir, file_name)
 
-    if not os.path.exists(destination):
+    if not _is_complete_download(destination, file_data.get('fileLength')):
         curseforge.download_file(download_url, destination)
 
-    side_label = _detect_side_label(file_data.get('gameVersions'))
-    logo = mod_data.get('logo') or {}
-    entry = {
-        'mod_id': mod_id,
-        'file_id': file_id,
-        'name': mod_data.get('name'),
-        'summary': mod_data.get('summary'),
-        'file_name': file_name,
-        'file_length': file_data.get('fileLength'),
-        'download_count': mod_data.get('downloadCount'),
-        'logo_url': logo.get('thumbnailUrl') or logo.get('url'),
-        'installed_at': _iso_now(),
-        'side_label': side_label,
-        'auto_installed': bool(auto_installed),
-        'auto_update': bool(auto_update),
-    }
-    _upsert_manifest_entry(manifest, entry)
+    return mod_data, file_data, file_name
 
-    dependencies = file_data.get('dependencies') or []
-    if not dependencies:
-        return
 
-    for dependency in dependencies:
-        relation_type = dependency.get('relationType')
-        dep_mod_id = dependency.get('modId')
-        if relation_type not in REQUIRED_RELATIONS or not dep_mod_id:
-            continue
-        dep_files = cache['files'].get(dep_mod_id)
-        if dep_files is None:
-            dep_resp, error = curseforge.get_mod_files(
-                api_key,
-                dep_mod_id,
-                params={'pageSize': 50, 'index': 0},
-            )
-            if error:
-                raise RuntimeError(f"Failed to load files for dependency {dep_mod_id}: {error}")
-            dep_files = dep_resp.get('data') or []
-            cache['files'][dep_mod_id] = dep_files
-        dep_file = _select_best_file(dep_files, server_version)
-        if not dep_file:
-            raise RuntimeError(f"No compatible file found for dependency {dep_mod_id}")
-        _install_mod_recursive(
-            server_id,
-            dep_mod_id,
-            dep_file.get('id'),
+def _fetch_dependency_files(dep_mod_id, api_key, cache):
+    dep_files = cache['files'].get(dep_mod_id)
+    if dep_files is None:
+        dep_resp, error = curseforge.get_mod_files(
             api_key,
-            server_version,
-            manifest,
-            visited,
-            cache,
-            auto_installed=True,
-            auto_update=False,
+            dep_mod_id,
+            params={'pageSize': 50, 'index': 0},
         )
+        if error:
+            raise RuntimeError(f"Failed to load files for dependency {dep_mod_id}: {error}")
+        dep_files = dep_resp.get('data') or []
+        cache['files'][dep_mod_id] = dep_files
+    return dep_files
+
+
+def _install_mod_recursive(server_id, mod_id, file_id, api_key, server_version, manifest, visited, cache, auto_installed=False, auto_update=False, batch_ts=None):
+    """
+    Install a mod and its required dependencies.
+
+    Dependencies are resolved level by level; the CurseForge lookups and
+    downloads of one level run in parallel, while the manifest is only
+    updated from the calling thread. Every entry of one install shares
+    the same installed_at timestamp. The caller creates the mods directory.
+    """
+    mods_dir = _get_mods_dir(server_id)
+    if batch_ts is None:
+        batch_ts = _iso_now()
+
+    index = cache.get('manifest_index')
+    if index is None:
+        index = cache['manifest_index'] = _build_manifest_index(manifest.get('mods', []))
+
+    level = [(mod_id, file_id, auto_installed, auto_update)]
+    with ThreadPoolExecutor(max_workers=MOD_INSTALL_WORKERS) as executor:
+        while level:
+            pending = []
+            for item in level:
+                key = (item[0], item[1])
+                if key in visited:
+                    continue
+                visited.add(key)
+                pending.append(item)
+            if not pending:
+                break
+
+            futures = [
+                executor.submit(_fetch_mod_file, server_id, mods_dir, item[0], item[1], api_key, cache)
+                for item in pending
+            ]
+            results = [future.result() for future in futures]
+
+            dep_mod_ids = []
+            for (item_mod_id, item_file_id, item_auto_installed, item_auto_update), result in zip(pending, results):
+                mod_data, file_data, file_name = result
+                side_label = _detect_side_label(file_data.get('gameVersions'))
+                logo = mod_data.get('logo') or {}
+                entry = {
+                    'mod_id': item_mod_id,
+                    'file_id': item_file_id,
+                    'name': mod_data.get('name'),
+                    'summary': mod_data.get('summary'),
+                    'file_name': file_name,
+                    'file_length': file_data.get('fileLength'),
+                    'download_count': mod_data.get('downloadCount'),
+                    'logo_url': logo.get('thumbnailUrl') or logo.get('url'),
+                    'installed_at': batch_ts,
+                    'side_label': side_label,
+                    'auto_installed': bool(item_auto_installed),
+                    'auto_update': bool(item_auto_update),
+                }
+                _upsert_manifest_entry(manifest, entry, index)
+
+                for dependency in file_data.get('dependencies') or []:
+                    relation_type = dependency.get('relationType')
+                    dep_mod_id = dependency.get('modId')
+                    if relation_type not in REQUIRED_RELATIONS or not dep_mod_id:
+                        continue
+                    dep_mod_ids.append(dep_mod_id)
+
+            unique_dep_ids = list(dict.fromkeys(dep_mod_ids))
+            dep_files_by_mod = dict(zip(
+                unique_dep_ids,
+                executor.map(lambda dep_id: _fetch_dependency_files(dep_id, api_key, cache), unique_dep_ids)
+            ))
+
+            level = []
+            for dep_mod_id in dep_mod_ids:
+                dep_file = _select_best_file(dep_files_by_mod[dep_mod_id], server_version)
+                if not dep_file:
+                    raise RuntimeError(f"No compatible file found for dependency {dep_mod_id}")
+                level.append((dep_mod_id, dep_file.get('id'), True, False))
 
 
 def _apply_auto_updates(server_id, manifest, api_key, server_version):
@@ -409,6 +845,7 @@ def _apply_auto_updates(server_id, manifest, api_key, server_version):
     os.makedirs(mods_dir, exist_ok=True)
     cache = {}
     updated = []
+    batch_ts = _iso_now()
 
     for entry in manifest.get('mods', []):
         if not entry.get('auto_update'):
@@ -439,7 +876,7 @@ def _apply_auto_updates(server_id, manifest, api_key, server_version):
 
         file_name = _sanitize_filename(latest_file.get('fileName'), f"{mod_id}-{latest_id}.jar")
         destination = os.path.join(mods_dir, file_name)
-        if not os.path.exists(destination):
+        if not _is_complete_download(destination, latest_file.get('fileLength')):
             download_url = latest_file.get('downloadUrl')
             if not download_url:
                 download_resp, error = curseforge.get_download_url(api_key, mod_id, latest_id)
@@ -461,16 +898,18 @@ def _apply_auto_updates(server_id, manifest, api_key, server_version):
         old_name = entry.get('file_name')
         if old_name and old_name != file_name:
             old_path = os.path.join(mods_dir, _sanitize_filename(old_name, old_name))
-            if os.path.exists(old_path):
+            try:
                 os.remove(old_path)
+            except FileNotFoundError:
+                pass
 
         old_file_id = entry.get('file_id')
         old_file_name = entry.get('file_name')
         entry['file_id'] = latest_id
         entry['file_name'] = file_name
         entry['file_length'] = latest_file.get('fileLength')
-        entry['installed_at'] = _iso_now()
-        entry['updated_at'] = _iso_now()
+        entry['installed_at'] = batch_ts
+        entry['updated_at'] = batch_ts
         entry['restart_required'] = True
         updated.append({
             'name': entry.get('name') or file_name,
@@ -484,15 +923,19 @@ def _apply_auto_updates(server_id, manifest, api_key, server_version):
     return updated
 
 
+# Manifest fields an auto-update changes; everything else (e.g. the
+# auto_update toggle) keeps whatever the current manifest says
+AUTO_UPDATE_FIELDS = ('file_id', 'file_name', 'file_length', 'installed_at', 'updated_at', 'restart_required')
+
+
 def _clear_restart_required(server_id):
-    manifest = _load_mod_manifest(server_id)
-    changed = False
-    for entry in manifest.get('mods', []):
-        if entry.get('restart_required'):
-            entry['restart_required'] = False
-            changed = True
-    if changed:
-        _save_mod_manifest(server_id, manifest)
+    # Cheap check on the cached copy first; most starts have nothing to clear
+    if not any(entry.get('restart_required') for entry in _get_mod_manifest(server_id).get('mods', [])):
+        return
+    with _manifest_txn(server_id) as manifest:
+        for entry in manifest.get('mods', []):
+            if entry.get('restart_required'):
+                entry['restart_required'] = False
 
 
 def apply_auto_updates_for_server(server_id):
@@ -500,13 +943,107 @@ def apply_auto_updates_for_server(server_id):
     if error:
         return [], error
 
+    # Downloads happen on a private copy; only the results are merged back
     manifest = _load_mod_manifest(server_id)
     server_version = server_manager.get_server_version(server_id)
     updated_mods = _apply_auto_updates(server_id, manifest, api_key, server_version)
     if updated_mods:
-        _save_mod_manifest(server_id, manifest)
+        updated_entries = {
+            item.get('mod_id'): item for item in manifest.get('mods', [])
+            if item.get('mod_id') in {mod['mod_id'] for mod in updated_mods}
+        }
+        with _manifest_txn(server_id) as current:
+            for entry in current.get('mods', []):
+                new_entry = updated_entries.pop(entry.get('mod_id'), None)
+                if new_entry is not None:
+                    for field in AUTO_UPDATE_FIELDS:
+                        entry[field] = new_entry.get(field)
+            # Mods uninstalled while the update ran stay uninstalled
+            for orphan in updated_entries.values():
+                try:
+                    os.remove(os.path.join(_get_mods_dir(server_id), orphan['file_name']))
+                except OSError:
+                    pass
+        updated_mods = [mod for mod in updated_mods if mod['mod_id'] not in updated_entries]
     return updated_mods, None
 
+def _create_mod_install_job(server_id, mod_id, file_id):
+    now = time.time()
+    job = {
+        'job_id': secrets.token_hex(8),
+        'server_id': server_id,
+        'mod_id': mod_id,
+        'file_id': file_id,
+        'state': 'queued',
+        'error': None,
+        'created_at': now,
+        'finished_at': None,
+    }
+    with _mod_install_jobs_lock:
+        for stale_id in [
+            job_id for job_id, item in _mod_install_jobs.items()
+            if item['finished_at'] and now - item['finished_at'] > MOD_INSTALL_JOB_TTL
+        ]:
+            del _mod_install_jobs[stale_id]
+        _mod_install_jobs[job['job_id']] = job
+    return dict(job)
+
+
+def _get_mod_install_job(job_id):
+    with _mod_install_jobs_lock:
+        job = _mod_install_jobs.get(job_id)
+        return dict(job) if job else None
+
+
+def _update_mod_install_job(job_id, socketio, **changes):
+    with _mod_install_jobs_lock:
+        job = _mod_install_jobs[job_id]
+        job.update(changes)
+        snapshot = dict(job)
+    if socketio:
+        try:
+            socketio.emit('mod_install_progress', snapshot, to=f"mods_{snapshot['server_id']}")
+        except Exception as exc:
+            log.warning("Error emitting mod install progress for job %s: %s", job_id, exc)
+
+
+def _run_mod_install_job(job_id, api_key, auto_update, socketio):
+    """Install a mod and its dependencies outside of the request thread"""
+    job = _get_mod_install_job(job_id)
+    server_id, mod_id, file_id = job['server_id'], job['mod_id'], job['file_id']
+    # One install per server at a time; manifest writes merge under _manifest_txn
+    with _mod_install_server_locks[server_id]:
+        _update_mod_install_job(job_id, socketio, state='running')
+        try:
+            manifest = _load_mod_manifest(server_id)
+            before = copy.deepcopy(manifest)
+            server_version = server_manager.get_server_version(server_id)
+            os.makedirs(_get_mods_dir(server_id), exist_ok=True)
+            _install_mod_recursive(
+                server_id,
+                mod_id,
+                file_id,
+                api_key,
+                server_version,
+                manifest,
+                set(),
+                _new_install_cache(),
+                auto_installed=False,
+                auto_update=auto_update,
+            )
+            # Merge into the manifest as it is now, not the copy loaded before
+            # the downloads, so concurrent uninstalls/toggles are kept
+            _merge_installed_entries(server_id, before, manifest)
+        except Exception as exc:
+            error_text = str(exc)
+            _log_mod_install_error(server_id, mod_id, file_id, error_text)
+            _log_mod_install_error(server_id, mod_id, file_id, traceback.format_exc().strip())
+            log.exception("Error installing mod %s file %s on server %s", mod_id, file_id, server_id)
+            _update_mod_install_job(job_id, socketio, state='failed', error=error_text, finished_at=time.time())
+            return
+    _update_mod_install_job(job_id, socketio, state='done', finished_at=time.time())
+
+
 @bp.route('/server/<int:server_id>')
 @login_required
 @require_permission('view_servers')
@@ -514,7 +1051,7 @@ def console_view(server_id):
     """Console view page for a specific server"""
 
     # Get server from database
-    server = Server.get_by_id(server_id)
+    server = _get_server_or_404(server_id)
 
     if not server:
         return render_template('404.html'), 404
@@ -748,86 +1285,42 @@ def webhooks_view(server_id):
 @bp.route('/api/server/<int:server_id>/config-files')
 @login_required
 @require_permission('manage_configs')
+@_require_server_access
 def get_config_files(server_id):
-    server = _get_server_or_404(server_id)
-    if not server:
-        return jsonify({'success': False, 'error': 'Server not found'}), 404
-    if not _has_server_access(server_id):
-        return jsonify({'success': False, 'error': 'Forbidden'}), 403
-
     file_map = _get_config_file_map(server_id)
-    labels = {
-        'config.json': 'Main configuration (config.json)',
-        'permissions.json': 'Permissions (permissions.json)',
-        'bans.json': 'Bans (bans.json)',
-        'whitelist.json': 'Whitelist (whitelist.json)'
-    }
-    files = []
-    for name in labels.keys():
-        if name in file_map:
-            files.append({
-                'value': name,
-                'label': labels[name]
-            })
+    files = [
+        {'value': name, 'label': label}
+        for name, label in CONFIG_FILE_LABELS if name in file_map
+    ]
 
     return jsonify({'success': True, 'files': files})
 
 @bp.route('/api/server/<int:server_id>/world-files')
 @login_required
 @require_permission('manage_configs')
+@_require_server_access
 def get_world_files(server_id):
-    server = _get_server_or_404(server_id)
-    if not server:
-        return jsonify({'success': False, 'error': 'Server not found'}), 404
-    if not _has_server_access(server_id):
-        return jsonify({'success': False, 'error': 'Forbidden'}), 403
-
-    file_map = _get_world_file_map(server_id)
-    files = []
-
-    if 'config.json' in file_map:
-        files.append({
-            'value': 'config.json',
-            'label': 'World Config (config.json)',
-            'description': 'Global world settings.'
-        })
-    if 'memories.json' in file_map:
-        files.append({
-            'value': 'memories.json',
-            'label': 'Memories (memories.json)',
-            'description': 'Server memories and history.'
-        })
-
-    for name in sorted(file_map.keys()):
-        if name.startswith('resources/'):
-            filename = name.split('/', 1)[1]
-            files.append({
-                'value': name,
-                'label': f'Resource: {filename}',
-                'description': 'World resource file.'
-            })
+    files = [
+        {'value': value, 'label': label, 'description': description}
+        for value, _, label, description in _get_world_file_entries(server_id)
+    ]
 
     return jsonify({'success': True, 'files': files})
 
 @bp.route('/api/server/<int:server_id>/player-files')
 @login_required
 @require_permission('manage_configs')
+@_require_server_access
 def get_player_files(server_id):
-    server = _get_server_or_404(server_id)
-    if not server:
-        return jsonify({'success': False, 'error': 'Server not found'}), 404
-    if not _has_server_access(server_id):
-        return jsonify({'success': False, 'error': 'Forbidden'}), 403
-
     file_map = _get_player_file_map(server_id)
     files = []
     for name in sorted(file_map.keys()):
         display_name = name
         try:
-            data = _read_json_file(file_map[name])
+            data = _read_json_file_cached(file_map[name])
             display_name = _extract_player_display_name(data, name)
-        except Exception as e:
-            print(f"Error reading player file {name}: {e}")
+        except Exception:
+            log.exception("Error reading player file %s", name)
         files.append({
             'value': name,
             'label': display_name,
@@ -840,22 +1333,17 @@ def get_player_files(server_id):
 @bp.route('/api/server/<int:server_id>/player-summaries')
 @login_required
 @require_permission('manage_configs')
+@_require_server_access
 def get_player_summaries(server_id):
-    server = _get_server_or_404(server_id)
-    if not server:
-        return jsonify({'success': False, 'error': 'Server not found'}), 404
-    if not _has_server_access(server_id):
-        return jsonify({'success': False, 'error': 'Forbidden'}), 403
-
     file_map = _get_player_file_map(server_id)
     players = []
     for filename, path in file_map.items():
         uuid = filename.rsplit('.json', 1)[0]
         try:
-            data = _read_json_file(path)
+            data = _read_json_file_cached(path)
             display_name = _extract_player_display_name(data, uuid)
-        except Exception as e:
-            print(f"Error reading player file {filename}: {e}")
+        except Exception:
+            log.exception("Error reading player file %s", filename)
             display_name = uuid
         players.append({
             'uuid': uuid,
@@ -907,8 +1395,8 @@ def _read_avatar_cache(avatar_id, allow_stale=False):
                 if cached_type:
                     content_type = cached_type
         return payload, content_type
-    except Exception as e:
-        print(f"Error reading avatar cache for {avatar_id}: {e}")
+    except Exception:
+        log.exception("Error reading avatar cache for %s", avatar_id)
         return None
 
 
@@ -919,8 +1407,8 @@ def _write_avatar_cache(avatar_id, payload, content_type):
             file.write(payload)
         with open(type_path, 'w', encoding='utf-8') as file:
             file.write((content_type or 'image/png').strip() or 'image/png')
-    except Exception as e:
-        print(f"Error writing avatar cache for {avatar_id}: {e}")
+    except Exception:
+        log.exception("Error writing avatar cache for %s", avatar_id)
 
 
 @bp.route('/api/items/<item_id>')
@@ -934,8 +1422,8 @@ def get_item_metadata(item_id):
             payload = response.read()
         data = json.loads(payload.decode('utf-8'))
         return jsonify(data)
-    except Exception as e:
-        print(f"Error fetching item metadata {item_id}: {e}")
+    except Exception:
+        log.exception("Error fetching item metadata %s", item_id)
         return jsonify({'error': 'Failed to fetch item metadata'}), 502
 
 
@@ -949,21 +1437,16 @@ def get_item_image(item_id):
         with urllib.request.urlopen(url) as response:
             payload = response.read()
         return current_app.response_class(payload, mimetype='image/png')
-    except Exception as e:
-        print(f"Error fetching item image {item_id}: {e}")
+    except Exception:
+        log.exception("Error fetching item image %s", item_id)
         return jsonify({'error': 'Failed to fetch item image'}), 502
 
 
 @bp.route('/api/server/<int:server_id>/avatar/<path:avatar_id>')
 @login_required
 @require_permission('manage_configs')
+@_require_server_access
 def get_player_avatar(server_id, avatar_id):
-    server = _get_server_or_404(server_id)
-    if not server:
-        return jsonify({'success': False, 'error': 'Server not found'}), 404
-    if not _has_server_access(server_id):
-        return jsonify({'success': False, 'error': 'Forbidden'}), 403
-
     avatar_id = (avatar_id or '').strip()
     if not avatar_id:
         return jsonify({'success': False, 'error': 'Missing avatar id'}), 400
@@ -986,8 +1469,8 @@ def get_player_avatar(server_id, avatar_id):
             content_type = response.headers.get_content_type() or 'image/png'
         _write_avatar_cache(avatar_id, payload, content_type)
         return current_app.response_class(payload, mimetype=content_type)
-    except Exception as e:
-        print(f"Error fetching avatar {avatar_id}: {e}")
+    except Exception:
+        log.exception("Error fetching avatar %s", avatar_id)
         stale_avatar = _read_avatar_cache(avatar_id, allow_stale=True)
         if stale_avatar:
             payload, content_type = stale_avatar
@@ -997,118 +1480,101 @@ def get_player_avatar(server_id, avatar_id):
 @bp.route('/api/server/<int:server_id>/config-file', methods=['GET', 'POST'])
 @login_required
 @require_permission('manage_configs')
+@_require_server_access
 def config_file(server_id):
-    server = _get_server_or_404(server_id)
-    if not server:
-        return jsonify({'success': False, 'error': 'Server not found'}), 404
-    if not _has_server_access(server_id):
-        return jsonify({'success': False, 'error': 'Forbidden'}), 403
-
     name = request.args.get('name', '')
+    # Reject impossible names before touching the file map / disk
+    if name not in CONFIG_FILE_NAMES:
+        return jsonify({'success': False, 'error': 'Config file not found'}), 404
     file_map = _get_config_file_map(server_id)
     if name not in file_map:
         return jsonify({'success': False, 'error': 'Config file not found'}), 404
 
     if request.method == 'GET':
         try:
-            data = _read_json_file(file_map[name])
-            return jsonify({'success': True, 'data': data})
-        except Exception as e:
-            print(f"Error reading config file: {e}")
+            return _json_file_response(file_map[name])
+        except Exception:
+            log.exception("Error reading config file")
             return jsonify({'success': False, 'error': 'Failed to read config file'}), 500
 
-    payload = request.get_json(silent=True)
-    if payload is None:
-        return jsonify({'success': False, 'error': 'Missing JSON payload'}), 400
+    data, error = _read_file_payload()
+    if error:
+        return error
 
-    data = payload.get('data', payload)
     try:
         _write_json_file(file_map[name], data)
         return jsonify({'success': True})
-    except Exception as e:
-        print(f"Error writing config file: {e}")
+    except Exception:
+        log.exception("Error writing config file")
         return jsonify({'success': False, 'error': 'Failed to write config file'}), 500
 
 @bp.route('/api/server/<int:server_id>/world-file', methods=['GET', 'POST'])
 @login_required
 @require_permission('manage_configs')
+@_require_server_access
 def world_file(server_id):
-    server = _get_server_or_404(server_id)
-    if not server:
-        return jsonify({'success': False, 'error': 'Server not found'}), 404
-    if not _has_server_access(server_id):
-        return jsonify({'success': False, 'error': 'Forbidden'}), 403
-
     name = request.args.get('name', '')
+    # Reject impossible names before touching the file map / disk
+    if not name.endswith('.json'):
+        return jsonify({'success': False, 'error': 'World file not found'}), 404
     file_map = _get_world_file_map(server_id)
     if name not in file_map:
         return jsonify({'success': False, 'error': 'World file not found'}), 404
 
     if request.method == 'GET':
         try:
-            data = _read_json_file(file_map[name])
-            return jsonify({'success': True, 'data': data})
-        except Exception as e:
-            print(f"Error reading world file: {e}")
+            return _json_file_response(file_map[name])
+        except Exception:
+            log.exception("Error reading world file")
             return jsonify({'success': False, 'error': 'Failed to read world file'}), 500
 
-    payload = request.get_json(silent=True)
-    if payload is None:
-        return jsonify({'success': False, 'error': 'Missing JSON payload'}), 400
+    data, error = _read_file_payload()
+    if error:
+        return error
 
-    data = payload.get('data', payload)
     try:
         _write_json_file(file_map[name], data)
         return jsonify({'success': True})
-    except Exception as e:
-        print(f"Error writing world file: {e}")
+    except Exception:
+        log.exception("Error writing world file")
         return jsonify({'success': False, 'error': 'Failed to write world file'}), 500
 
 @bp.route('/api/server/<int:server_id>/player-file', methods=['GET', 'POST'])
 @login_required
 @require_permission('manage_configs')
+@_require_server_access
 def player_file(server_id):
-    server = _get_server_or_404(server_id)
-    if not server:
-        return jsonify({'success': False, 'error': 'Server not found'}), 404
-    if not _has_server_access(server_id):
-        return jsonify({'success': False, 'error': 'Forbidden'}), 403
-
     name = request.args.get('name', '')
+    # Reject impossible names before touching the file map / disk
+    if not name.endswith('.json'):
+        return jsonify({'success': False, 'error': 'Player file not found'}), 404
     file_map = _get_player_file_map(server_id)
     if name not in file_map:
         return jsonify({'success': False, 'error': 'Player file not found'}), 404
 
     if request.method == 'GET':
         try:
-            data = _read_json_file(file_map[name])
-            return jsonify({'success': True, 'data': data})
-        except Exception as e:
-            print(f"Error reading player file: {e}")
+            return _json_file_response(file_map[name])
+        except Exception:
+            log.exception("Error reading player file")
             return jsonify({'success': False, 'error': 'Failed to read player file'}), 500
 
-    payload = request.get_json(silent=True)
-    if payload is None:
-        return jsonify({'success': False, 'error': 'Missing JSON payload'}), 400
+    data, error = _read_file_payload()
+    if error:
+        return error
 
-    data = payload.get('data', payload)
     try:
         _write_json_file(file_map[name], data)
         return jsonify({'success': True})
-    except Exception as e:
-        print(f"Error writing player file: {e}")
+    except Exception:
+        log.exception("Error writing player file")
         return jsonify({'success': False, 'error': 'Failed to write player file'}), 500
 
 @bp.route('/api/server/<int:server_id>/backup-settings', methods=['GET', 'POST'])
 @login_required
 @require_permission('manage_configs')
+@_require_server_access
 def backup_settings(server_id):
-    server = _get_server_or_404(server_id)
-    if not server:
-        return jsonify({'success': False, 'error': 'Server not found'}), 404
-    if not _has_server_access(server_id):
-        return jsonify({'success': False, 'error': 'Forbidden'}), 403
-
     if request.method == 'GET':
         settings = server_manager.read_backup_settings(server_id)
         worlds = server_manager.list_worlds(server_id)
@@ -1131,12 +1597,9 @@ def backup_settings(server_id):
 @bp.route('/api/server/<int:server_id>/startup-settings', methods=['GET', 'POST'])
 @login_required
 @require_permission('manage_servers')
+@_require_server_access
 def startup_settings(server_id):
     server = _get_server_or_404(server_id)
-    if not server:
-        return jsonify({'success': False, 'error': 'Server not found'}), 404
-    if not _has_server_access(server_id):
-        return jsonify({'success': False, 'error': 'Forbidden'}), 403
 
     if request.method == 'GET':
         settings = server_manager.read_startup_settings(server_id)
@@ -1198,12 +1661,9 @@ def startup_settings(server_id):
 @bp.route('/api/server/<int:server_id>/port-check')
 @login_required
 @require_permission('manage_servers')
+@_require_server_access
 def check_server_port(server_id):
     server = _get_server_or_404(server_id)
-    if not server:
-        return jsonify({'success': False, 'error': 'Server not found'}), 404
-    if not _has_server_access(server_id):
-        return jsonify({'success': False, 'error': 'Forbidden'}), 403
 
     port_value = request.args.get('port', type=int)
     if not port_value:
@@ -1230,26 +1690,16 @@ def check_server_port(server_id):
 @bp.route('/api/server/<int:server_id>/backups', methods=['GET'])
 @login_required
 @require_permission('manage_configs')
+@_require_server_access
 def list_backups(server_id):
-    server = _get_server_or_404(server_id)
-    if not server:
-        return jsonify({'success': False, 'error': 'Server not found'}), 404
-    if not _has_server_access(server_id):
-        return jsonify({'success': False, 'error': 'Forbidden'}), 403
-
     backups = server_manager.list_backups(server_id)
     return jsonify({'success': True, 'backups': backups})
 
 @bp.route('/api/server/<int:server_id>/backups/run', methods=['POST'])
 @login_required
 @require_permission('manage_configs')
+@_require_server_access
 def run_backup(server_id):
-    server = _get_server_or_404(server_id)
-    if not server:
-        return jsonify({'success': False, 'error': 'Server not found'}), 404
-    if not _has_server_access(server_id):
-        return jsonify({'success': False, 'error': 'Forbidden'}), 403
-
     payload = request.get_json(silent=True) or {}
     backup_type = payload.get('mode', 'worlds')
     selected_worlds = payload.get('selected_worlds', [])
@@ -1263,19 +1713,15 @@ def run_backup(server_id):
         return jsonify({'success': True, 'created': created})
     except ValueError as e:
         return jsonify({'success': False, 'error': str(e)}), 400
-    except Exception as e:
-        print(f"Error creating backup for server {server_id}: {e}")
+    except Exception:
+        log.exception("Error creating backup for server %s", server_id)
         return jsonify({'success': False, 'error': 'Backup failed'}), 500
 
 @bp.route('/api/server/<int:server_id>/backups/restore', methods=['POST'])
 @login_required
 @require_permission('manage_configs')
+@_require_server_access
 def restore_backup(server_id):
-    server = _get_server_or_404(server_id)
-    if not server:
-        return jsonify({'success': False, 'error': 'Server not found'}), 404
-    if not _has_server_access(server_id):
-        return jsonify({'success': False, 'error': 'Forbidden'}), 403
     if server_manager.is_server_running(server_id):
         return jsonify({'success': False, 'error': 'Stop the server before restoring backups.'}), 400
 
@@ -1288,10 +1734,23 @@ def restore_backup(server_id):
         return jsonify({'success': True})
     except ValueError as e:
         return jsonify({'success': False, 'error': str(e)}), 400
-    except Exception as e:
-        print(f"Error restoring backup for server {server_id}: {e}")
+    except Exception:
+        log.exception("Error restoring backup for server %s", server_id)
         return jsonify({'success': False, 'error': 'Restore failed'}), 500
 
+RESTART_WAIT_TIMEOUT = 5
+
+def _wait_for_server_shutdown(server_id, port, timeout=RESTART_WAIT_TIMEOUT):
+    """Poll with backoff until the server stopped and released its port"""
+    deadline = time.monotonic() + timeout
+    delay = 0.05
+    while time.monotonic() < deadline:
+        if not server_manager.is_server_running(server_id) and port_checker.is_port_available(port):
+            return True
+        time.sleep(delay)
+        delay = min(delay * 2, 0.5)
+    return False
+
 @bp.route('/api/server/<int:server_id>/start', methods=['POST'])
 @login_required
 @require_permission('manage_servers')
@@ -1300,15 +1759,24 @@ def start_server(server_id):
 
     try:
         # Get server from database
-        server = Server.get_by_id(server_id)
+        server = _get_server_or_404(server_id)
 
         if not server:
             return jsonify({'success': False, 'error': 'Server not found'}), 404
+        if not _has_server_access(server_id):
+            return jsonify({'success': False, 'error': 'Forbidden'}), 403
 
         # Check if already running
         if server_manager.is_server_running(server_id):
             return jsonify({'success': False, 'error': 'Server is already running'}), 400
 
+        # Check if game files exist (one scandir, cheaper than the Java probe)
+        if not server_manager.has_game_files(server_id):
+            return jsonify({
+                'success': False,
+                'error': 'Server files are missing. Please download Hytale server files.'
+            }), 400
+
         # Check Java installation
         java_info = java_checker.check_java()
         if not java_info['installed']:
@@ -1318,33 +1786,26 @@ def start_server(server_id):
                 'java_download_url': java_checker.get_java_download_url()
             }), 400
 
-        # Check if game files exist
-        jar_path = server_manager.get_jar_path(server_id)
-        assets_path = server_manager.get_assets_path(server_id)
-        if not jar_path or not assets_path or not os.path.exists(jar_path) or not os.path.exists(assets_path):
-            return jsonify({
-                'success': False,
-                'error': 'Server files are missing. Please download Hytale server files.'
-            }), 400
+        # Claim the server; a concurrent start/stop loses the race here
+        if not _transition_status(server_id, STARTABLE_STATUSES, 'starting'):
+            return jsonify({'success': False, 'error': 'Server is already starting or stopping'}), 409
 
         try:
             server_manager.run_startup_backup(server_id)
-        except Exception as e:
-            print(f"Error running startup backup for server {server_id}: {e}")
+        except Exception:
+            log.exception("Error running startup backup for server %s", server_id)
+            _transition_status(server_id, ('starting',), 'offline')
             return jsonify({'success': False, 'error': 'Backup on start failed'}), 500
 
-        # Update status to starting
-        Server.update_status(server_id, 'starting')
-
         # Get SocketIO instance
-        from app import socketio
+        socketio = get_socketio()
 
         # Start server in new terminal window
         if server_manager.has_gotale_plugin(server_id):
             try:
                 gotale_config.ensure_gotale_config(server_id, create_if_missing=True)
-            except Exception as exc:
-                print(f"GoTale config update failed for server {server_id}: {exc}")
+            except Exception:
+                log.exception("GoTale config update failed for server %s", server_id)
         success = server_manager.start_server(
             server_id,
             server.port,
@@ -1354,18 +1815,19 @@ def start_server(server_id):
         )
 
         if not success:
-            Server.update_status(server_id, 'offline')
+            _transition_status(server_id, ('starting',), 'offline')
             return jsonify({'success': False, 'error': 'Failed to start server'}), 500
 
-        # Update status to online
-        Server.update_status(server_id, 'online')
+        # Finish the claim; a stop that took over mid-start wins
+        if not _transition_status(server_id, ('starting',), 'online'):
+            return jsonify({'success': False, 'error': 'Server was stopped while starting'}), 409
         _clear_restart_required(server_id)
 
         return jsonify({'success': True, 'message': 'Server started successfully'})
 
-    except Exception as e:
-        print(f"Error starting server: {e}")
-        Server.update_status(server_id, 'offline')
+    except Exception:
+        log.exception("Error starting server")
+        _transition_status(server_id, ('starting',), 'offline')
         return jsonify({'success': False, 'error': 'An unexpected error occurred'}), 500
 
 @bp.route('/api/server/<int:server_id>/stop', methods=['POST'])
@@ -1376,38 +1838,41 @@ def stop_server(server_id):
 
     try:
         # Get server from database
-        server = Server.get_by_id(server_id)
+        server = _get_server_or_404(server_id)
 
         if not server:
             return jsonify({'success': False, 'error': 'Server not found'}), 404
         if not _has_server_access(server_id):
             return jsonify({'success': False, 'error': 'Forbidden'}), 403
-        if not _has_server_access(server_id):
-            return jsonify({'success': False, 'error': 'Forbidden'}), 403
-        if not _has_server_access(server_id):
-            return jsonify({'success': False, 'error': 'Forbidden'}), 403
 
         # Check if running
         if not server_manager.is_server_running(server_id):
             return jsonify({'success': False, 'error': 'Server is not running'}), 400
 
-        # Update status to stopping
-        Server.update_status(server_id, 'stopping')
+        # Update status to stopping unless another request got there first
+        if not _transition_status(server_id, STOPPABLE_STATUSES, 'stopping'):
+            return jsonify({'success': False, 'error': 'Server is already starting or stopping'}), 409
 
         # Stop server
         success = server_manager.stop_server(server_id)
 
         if not success:
-            Server.update_status(server_id, 'online')
+            _transition_status(server_id, ('stopping',), 'online')
             return jsonify({'success': False, 'error': 'Failed to stop server'}), 500
 
-        # Update status to offline
-        Server.update_status(server_id, 'offline')
+        # Release the 'stopping' claim
+        _transition_status(server_id, ('stopping',), 'offline')
 
         return jsonify({'success': True, 'message': 'Server stopped successfully'})
 
-    except Exception as e:
-        print(f"Error stopping server: {e}")
+    except Exception:
+        log.exception("Error stopping server")
+        # Release the 'stopping' claim so later starts/stops are not blocked
+        try:
+            status = 'online' if server_manager.is_server_running(server_id) else 'offline'
+            _transition_status(server_id, ('stopping',), status)
+        except Exception:
+            log.exception("Error resetting status for server %s", server_id)
         return jsonify({'success': False, 'error': 'An unexpected error occurred'}), 500
 
 @bp.route('/api/server/<int:server_id>/restart', methods=['POST'])
@@ -1418,37 +1883,40 @@ def restart_server(server_id):
 
     try:
         # Get server from database
-        server = Server.get_by_id(server_id)
+        server = _get_server_or_404(server_id)
 
         if not server:
             return jsonify({'success': False, 'error': 'Server not found'}), 404
         if not _has_server_access(server_id):
             return jsonify({'success': False, 'error': 'Forbidden'}), 403
 
-        # Stop if running
+        # Stop if running; the status change also claims the server
         if server_manager.is_server_running(server_id):
-            Server.update_status(server_id, 'stopping')
+            if not _transition_status(server_id, STOPPABLE_STATUSES, 'stopping'):
+                return jsonify({'success': False, 'error': 'Server is already starting or stopping'}), 409
             server_manager.stop_server(server_id)
-
-        # Wait a moment
-        time.sleep(2)
+            # Wait until the process is gone and its port is free again
+            _wait_for_server_shutdown(server_id, server.port)
+            if not _transition_status(server_id, ('stopping',), 'starting'):
+                return jsonify({'success': False, 'error': 'Server status changed during restart'}), 409
+        elif not _transition_status(server_id, STARTABLE_STATUSES, 'starting'):
+            return jsonify({'success': False, 'error': 'Server is already starting or stopping'}), 409
 
         try:
             server_manager.run_startup_backup(server_id)
-        except Exception as e:
-            print(f"Error running startup backup for server {server_id}: {e}")
+        except Exception:
+            log.exception("Error running startup backup for server %s", server_id)
+            _transition_status(server_id, ('starting',), 'offline')
             return jsonify({'success': False, 'error': 'Backup on start failed'}), 500
 
         # Start server
-        Server.update_status(server_id, 'starting')
-
-        from app import socketio
+        socketio = get_socketio()
 
         if server_manager.has_gotale_plugin(server_id):
             try:
                 gotale_config.ensure_gotale_config(server_id, create_if_missing=True)
-            except Exception as exc:
-                print(f"GoTale config update failed for server {server_id}: {exc}")
+            except Exception:
+                log.exception("GoTale config update failed for server %s", server_id)
         success = server_manager.start_server(
             server_id,
             server.port,
@@ -1458,17 +1926,19 @@ def restart_server(server_id):
         )
 
         if not success:
-            Server.update_status(server_id, 'offline')
+            _transition_status(server_id, ('starting',), 'offline')
             return jsonify({'success': False, 'error': 'Failed to start server'}), 500
 
-        Server.update_status(server_id, 'online')
+        # Finish the claim; a stop that took over mid-start wins
+        if not _transition_status(server_id, ('starting',), 'online'):
+            return jsonify({'success': False, 'error': 'Server was stopped while starting'}), 409
         _clear_restart_required(server_id)
 
         return jsonify({'success': True, 'message': 'Server restarted successfully'})
 
-    except Exception as e:
-        print(f"Error restarting server: {e}")
-        Server.update_status(server_id, 'offline')
+    except Exception:
+        log.exception("Error restarting server")
+        _transition_status(server_id, ('starting', 'stopping'), 'offline')
         return jsonify({'success': False, 'error': 'An unexpected error occurred'}), 500
 
 @bp.route('/api/server/<int:server_id>/status')
@@ -1479,7 +1949,7 @@ def get_status(server_id):
 
     try:
         # Get server from database
-        server = Server.get_by_id(server_id)
+        server = _get_server_or_404(server_id)
 
         if not server:
             return jsonify({'success': False, 'error': 'Server not found'}), 404
@@ -1490,13 +1960,14 @@ def get_status(server_id):
         is_running = server_manager.is_server_running(server_id)
         status = server.status
 
-        # Reconcile DB status with actual process state
-        if is_running and status != 'online':
-            status = 'online'
-            Server.update_status(server_id, status)
-        elif not is_running and status in ('online', 'starting', 'stopping'):
-            status = 'offline'
-            Server.update_status(server_id, status)
+        # Reconcile DB status with actual process state; 'starting'/'stopping'
+        # are claims held by an in-flight request and are left alone
+        if is_running and status == 'offline':
+            if _transition_status(server_id, ('offline',), 'online'):
+                status = 'online'
+        elif not is_running and status == 'online':
+            if _transition_status(server_id, ('online',), 'offline'):
+                status = 'offline'
 
         return jsonify({
             'success': True,
@@ -1505,8 +1976,8 @@ def get_status(server_id):
             'port': server.port
         })
 
-    except Exception as e:
-        print(f"Error getting server status: {e}")
+    except Exception:
+        log.exception("Error getting server status")
         return jsonify({'success': False, 'error': 'An unexpected error occurred'}), 500
 
 @bp.route('/api/server/<int:server_id>/auth-status')
@@ -1515,14 +1986,12 @@ def get_status(server_id):
 def get_auth_status(server_id):
     """API endpoint to get server authentication status"""
     try:
-        server = Server.get_by_id(server_id)
+        server = _get_server_or_404(server_id)
 
         if not server:
             return jsonify({'success': False, 'error': 'Server not found'}), 404
         if not _has_server_access(server_id):
             return jsonify({'success': False, 'error': 'Forbidden'}), 403
-        if not _has_server_access(server_id):
-            return jsonify({'success': False, 'error': 'Forbidden'}), 403
 
         auth_status = server_manager.get_server_auth_status(server_id)
 
@@ -1533,21 +2002,16 @@ def get_auth_status(server_id):
             'auth_code': auth_status['auth_code']
         })
 
-    except Exception as e:
-        print(f"Error getting auth status: {e}")
+    except Exception:
+        log.exception("Error getting auth status")
         return jsonify({'success': False, 'error': 'An unexpected error occurred'}), 500
 
 
 @bp.route('/api/server/<int:server_id>/gotale/config')
 @login_required
 @require_permission('view_servers')
+@_require_server_access
 def get_gotale_config(server_id):
-    server = _get_server_or_404(server_id)
-    if not server:
-        return jsonify({'success': False, 'error': 'Server not found'}), 404
-    if not _has_server_access(server_id):
-        return jsonify({'success': False, 'error': 'Forbidden'}), 403
-
     settings = gotale_config.get_gotale_api_settings(server_id)
     if not settings:
         return jsonify({'success': True, 'configured': False}), 200
@@ -1565,13 +2029,8 @@ def get_gotale_config(server_id):
 @bp.route('/api/server/<int:server_id>/gotale/plugin-status')
 @login_required
 @require_permission('view_servers')
+@_require_server_access
 def gotale_plugin_status(server_id):
-    server = _get_server_or_404(server_id)
-    if not server:
-        return jsonify({'success': False, 'error': 'Server not found'}), 404
-    if not _has_server_access(server_id):
-        return jsonify({'success': False, 'error': 'Forbidden'}), 403
-
     installed = server_manager.has_gotale_plugin(server_id)
     return jsonify({'success': True, 'installed': installed})
 
@@ -1579,33 +2038,23 @@ def gotale_plugin_status(server_id):
 @bp.route('/api/server/<int:server_id>/gotale/install-plugin', methods=['POST'])
 @login_required
 @require_permission('manage_configs')
+@_require_server_access
 def gotale_install_plugin(server_id):
-    server = _get_server_or_404(server_id)
-    if not server:
-        return jsonify({'success': False, 'error': 'Server not found'}), 404
-    if not _has_server_access(server_id):
-        return jsonify({'success': False, 'error': 'Forbidden'}), 403
-
     ok, status = server_manager.ensure_gotale_plugin(server_id, force=True)
     if not ok:
         return jsonify({'success': False, 'error': status}), 500
     try:
         gotale_config.ensure_gotale_config(server_id, create_if_missing=True)
-    except Exception as exc:
-        print(f"GoTale config update failed for server {server_id}: {exc}")
+    except Exception:
+        log.exception("GoTale config update failed for server %s", server_id)
     return jsonify({'success': True, 'status': status})
 
 
 @bp.route('/api/server/<int:server_id>/gotale/proxy/<path:subpath>', methods=['GET', 'POST'])
 @login_required
 @require_permission('view_servers')
+@_require_server_access
 def proxy_gotale_api(server_id, subpath):
-    server = _get_server_or_404(server_id)
-    if not server:
-        return jsonify({'success': False, 'error': 'Server not found'}), 404
-    if not _has_server_access(server_id):
-        return jsonify({'success': False, 'error': 'Forbidden'}), 403
-
     settings = gotale_config.get_gotale_api_settings(server_id)
     if not settings or not settings.get('enabled'):
         return jsonify({'success': False, 'error': 'GoTaleManager API disabled'}), 400
@@ -1644,20 +2093,15 @@ def proxy_gotale_api(server_id, subpath):
             mimetype='application/json'
         )
     except Exception as exc:
-        print(f"GoTale proxy error for server {server_id}: {exc}")
+        log.warning("GoTale proxy error for server %s: %s", server_id, exc)
         return jsonify({'success': False, 'error': 'GoTaleManager unreachable'}), 502
 
 
 @bp.route('/api/server/<int:server_id>/gotale/webhooks', methods=['GET', 'POST'])
 @login_required
 @require_permission('manage_configs')
+@_require_server_access
 def gotale_webhooks(server_id):
-    server = _get_server_or_404(server_id)
-    if not server:
-        return jsonify({'success': False, 'error': 'Server not found'}), 404
-    if not _has_server_access(server_id):
-        return jsonify({'success': False, 'error': 'Forbidden'}), 403
-
     db_path = current_app.config['DATABASE']
     if request.method == 'POST':
         payload = request.get_json(silent=True) or {}
@@ -1671,13 +2115,8 @@ def gotale_webhooks(server_id):
 @bp.route('/api/server/<int:server_id>/gotale/webhooks/diagnostics')
 @login_required
 @require_permission('manage_configs')
+@_require_server_access
 def gotale_webhook_diagnostics(server_id):
-    server = _get_server_or_404(server_id)
-    if not server:
-        return jsonify({'success': False, 'error': 'Server not found'}), 404
-    if not _has_server_access(server_id):
-        return jsonify({'success': False, 'error': 'Forbidden'}), 403
-
     diagnostics = gotale_bridge.get_webhook_diagnostics(server_id)
     return jsonify({'success': True, 'diagnostics': diagnostics})
 
@@ -1706,20 +2145,15 @@ def _get_gotale_online_players_count(server_id):
         if isinstance(players, list):
             return len(players)
     except Exception as exc:
-        print(f"GoTale online player count failed for server {server_id}: {exc}")
+        log.warning("GoTale online player count failed for server %s: %s", server_id, exc)
     return None
 
 
 @bp.route('/api/server/<int:server_id>/gotale/dispatch', methods=['POST'])
 @login_required
 @require_permission('view_servers')
+@_require_server_access
 def gotale_dispatch(server_id):
-    server = _get_server_or_404(server_id)
-    if not server:
-        return jsonify({'success': False, 'error': 'Server not found'}), 404
-    if not _has_server_access(server_id):
-        return jsonify({'success': False, 'error': 'Forbidden'}), 403
-
     payload = request.get_json(silent=True) or {}
     event_type = payload.get('type')
     data = payload.get('payload') or {}
@@ -1750,20 +2184,15 @@ def gotale_dispatch(server_id):
     try:
         with urllib.request.urlopen(req, timeout=6):
             return jsonify({'success': True, 'sent': True})
-    except Exception as exc:
-        print(f"Discord webhook error for server {server_id}: {exc}")
+    except Exception:
+        log.exception("Discord webhook error for server %s", server_id)
         return jsonify({'success': False, 'error': 'Webhook send failed'}), 502
 
 @bp.route('/api/server/<int:server_id>/gotale/stats')
 @login_required
 @require_permission('view_servers')
+@_require_server_access
 def gotale_stats(server_id):
-    server = _get_server_or_404(server_id)
-    if not server:
-        return jsonify({'success': False, 'error': 'Server not found'}), 404
-    if not _has_server_access(server_id):
-        return jsonify({'success': False, 'error': 'Forbidden'}), 403
-
     days = request.args.get('days', 7)
     db_path = current_app.config['DATABASE']
     stats = gotale_events.get_stats(db_path, server_id, days)
@@ -1784,13 +2213,8 @@ def gotale_stats(server_id):
 @bp.route('/api/server/<int:server_id>/gotale/chat/logs')
 @login_required
 @require_permission('view_servers')
+@_require_server_access
 def gotale_chat_logs(server_id):
-    server = _get_server_or_404(server_id)
-    if not server:
-        return jsonify({'success': False, 'error': 'Server not found'}), 404
-    if not _has_server_access(server_id):
-        return jsonify({'success': False, 'error': 'Forbidden'}), 403
-
     limit = request.args.get('limit', 200)
     offset = request.args.get('offset', 0)
     db_path = current_app.config['DATABASE']
@@ -1801,13 +2225,8 @@ def gotale_chat_logs(server_id):
 @bp.route('/api/server/<int:server_id>/gotale/chat/search')
 @login_required
 @require_permission('view_servers')
+@_require_server_access
 def gotale_chat_search(server_id):
-    server = _get_server_or_404(server_id)
-    if not server:
-        return jsonify({'success': False, 'error': 'Server not found'}), 404
-    if not _has_server_access(server_id):
-        return jsonify({'success': False, 'error': 'Forbidden'}), 403
-
     query = (request.args.get('q') or '').strip()
     if not query:
         return jsonify({'success': True, 'messages': []})
@@ -1822,7 +2241,7 @@ def gotale_chat_search(server_id):
 def trigger_auth(server_id):
     """Force auth status or device login command"""
     try:
-        server = Server.get_by_id(server_id)
+        server = _get_server_or_404(server_id)
         if not server:
             return jsonify({'success': False, 'error': 'Server not found'}), 404
         if not _has_server_access(server_id):
@@ -1846,8 +2265,8 @@ def trigger_auth(server_id):
                 return jsonify({'success': False, 'error': 'Failed to send auth command'}), 500
 
         return jsonify({'success': True})
-    except Exception as e:
-        print(f"Error triggering auth for server {server_id}: {e}")
+    except Exception:
+        log.exception("Error triggering auth for server %s", server_id)
         return jsonify({'success': False, 'error': 'An unexpected error occurred'}), 500
 
 @bp.route('/api/server/<int:server_id>/console')
@@ -1856,7 +2275,7 @@ def trigger_auth(server_id):
 def get_console_output(server_id):
     """API endpoint to get recent console output"""
     try:
-        server = Server.get_by_id(server_id)
+        server = _get_server_or_404(server_id)
 
         if not server:
             return jsonify({'success': False, 'error': 'Server not found'}), 404
@@ -1871,21 +2290,16 @@ def get_console_output(server_id):
             'lines': output
         })
 
-    except Exception as e:
-        print(f"Error getting console output: {e}")
+    except Exception:
+        log.exception("Error getting console output")
         return jsonify({'success': False, 'error': 'An unexpected error occurred'}), 500
 
 
 @bp.route('/api/server/<int:server_id>/mods/search')
 @login_required
 @require_permission('manage_configs')
+@_require_server_access
 def search_mods(server_id):
-    server = Server.get_by_id(server_id)
-    if not server:
-        return jsonify({'success': False, 'error': 'Server not found'}), 404
-    if not _has_server_access(server_id):
-        return jsonify({'success': False, 'error': 'Forbidden'}), 403
-
     api_key, game_id, error = _get_curseforge_config()
     if error:
         return jsonify({'success': False, 'error': error}), 400
@@ -1913,19 +2327,15 @@ def search_mods(server_id):
         return jsonify({'success': False, 'error': error}), 502
 
     mods = resp.get('data') or []
-    if sort == 'creation':
-        mods = sorted(mods, key=lambda item: item.get('dateCreated') or '', reverse=True)
-
-    manifest = _load_mod_manifest(server_id)
-    installed_ids = {
-        item.get('mod_id') for item in manifest.get('mods', [])
-        if item.get('mod_id')
-    }
+    installed_ids = _installed_ids_cached(server_id)
     items = []
     for mod in mods:
         card = _build_mod_card(mod)
-        card['installed'] = bool(card.get('id') in installed_ids)
+        card['installed'] = card.get('id') in installed_ids
         items.append(card)
+    if sort == 'creation':
+        # CurseForge has no sortField for dateCreated, so order the page here
+        items.sort(key=_card_created_key, reverse=True)
     pagination = resp.get('pagination') or {}
 
     return jsonify({
@@ -1942,28 +2352,23 @@ def search_mods(server_id):
 @bp.route('/api/server/<int:server_id>/mods/<int:mod_id>/files')
 @login_required
 @require_permission('manage_configs')
+@_require_server_access
 def get_mod_files(server_id, mod_id):
-    server = Server.get_by_id(server_id)
-    if not server:
-        return jsonify({'success': False, 'error': 'Server not found'}), 404
-    if not _has_server_access(server_id):
-        return jsonify({'success': False, 'error': 'Forbidden'}), 403
-
     api_key, _, error = _get_curseforge_config()
     if error:
         return jsonify({'success': False, 'error': error}), 400
 
-    resp, error = curseforge.get_mod_files(api_key, mod_id, params={'pageSize': 50, 'index': 0})
+    file_params = {'pageSize': 50, 'index': 0}
+    resp, error = curseforge.get_mod_files(api_key, mod_id, params=file_params)
     if error:
         return jsonify({'success': False, 'error': error}), 502
 
     server_version = server_manager.get_server_version(server_id)
     files = []
-    for file in sorted(resp.get('data') or [], key=lambda item: item.get('fileDate') or '', reverse=True):
+    for file in sorted(resp.get('data') or [], key=_file_date_key, reverse=True):
         game_versions = file.get('gameVersions') or []
         side_label = _detect_side_label(game_versions)
-        release_type = file.get('releaseType')
-        release_label = {1: 'Release', 2: 'Beta', 3: 'Alpha'}.get(release_type)
+        release_label = MOD_RELEASE_LABELS.get(file.get('releaseType'))
         files.append({
             'id': file.get('id'),
             'display_name': file.get('displayName') or file.get('fileName'),
@@ -1985,13 +2390,8 @@ def get_mod_files(server_id, mod_id):
 @bp.route('/api/server/<int:server_id>/mods/install', methods=['POST'])
 @login_required
 @require_permission('manage_configs')
+@_require_server_access
 def install_mod(server_id):
-    server = Server.get_by_id(server_id)
-    if not server:
-        return jsonify({'success': False, 'error': 'Server not found'}), 404
-    if not _has_server_access(server_id):
-        return jsonify({'success': False, 'error': 'Forbidden'}), 403
-
     payload = request.get_json(silent=True) or {}
     mod_id = payload.get('mod_id')
     file_id = payload.get('file_id')
@@ -2003,45 +2403,36 @@ def install_mod(server_id):
     if error:
         return jsonify({'success': False, 'error': error}), 400
 
-    manifest = _load_mod_manifest(server_id)
-    server_version = server_manager.get_server_version(server_id)
-    visited = set()
-    cache = {'mods': {}, 'files': {}}
     try:
-        _install_mod_recursive(
-            server_id,
-            int(mod_id),
-            int(file_id),
-            api_key,
-            server_version,
-            manifest,
-            visited,
-            cache,
-            auto_installed=False,
-            auto_update=auto_update,
-        )
-    except Exception as exc:
-        error_text = str(exc)
-        _log_mod_install_error(server_id, mod_id, file_id, error_text)
-        traceback_text = traceback.format_exc()
-        _log_mod_install_error(server_id, mod_id, file_id, traceback_text.strip())
-        print(f"Error installing mod {mod_id} file {file_id} on server {server_id}: {error_text}")
-        return jsonify({'success': False, 'error': error_text}), 500
-
-    _save_mod_manifest(server_id, manifest)
-    return jsonify({'success': True})
+        mod_id = int(mod_id)
+        file_id = int(file_id)
+    except (TypeError, ValueError):
+        return jsonify({'success': False, 'error': 'Invalid mod or file ID'}), 400
+
+    socketio = get_socketio()
+    job = _create_mod_install_job(server_id, mod_id, file_id)
+    _mod_install_executor.submit(
+        _run_mod_install_job, job['job_id'], api_key, auto_update, socketio
+    )
+    return jsonify({'success': True, **job}), 202
+
+
+@bp.route('/api/server/<int:server_id>/mods/install/<job_id>')
+@login_required
+@require_permission('manage_configs')
+@_require_server_access
+def mod_install_status(server_id, job_id):
+    job = _get_mod_install_job(job_id)
+    if not job or job['server_id'] != server_id:
+        return jsonify({'success': False, 'error': 'Install job not found'}), 404
+    return jsonify({'success': True, **job})
 
 
 @bp.route('/api/server/<int:server_id>/mods/upload', methods=['POST'])
 @login_required
 @require_permission('manage_configs')
+@_require_server_access
 def upload_mod(server_id):
-    server = Server.get_by_id(server_id)
-    if not server:
-        return jsonify({'success': False, 'error': 'Server not found'}), 404
-    if not _has_server_access(server_id):
-        return jsonify({'success': False, 'error': 'Forbidden'}), 403
-
     if 'file' not in request.files:
         return jsonify({'success': False, 'error': 'No file provided'}), 400
     upload = request.files['file']
@@ -2059,8 +2450,8 @@ def upload_mod(server_id):
 
     try:
         upload.save(destination)
-    except Exception as exc:
-        print(f"Error uploading mod for server {server_id}: {exc}")
+    except Exception:
+        log.exception("Error uploading mod for server %s", server_id)
         return jsonify({'success': False, 'error': 'Upload failed'}), 500
 
     return jsonify({'success': True, 'file_name': filename})
@@ -2069,13 +2460,8 @@ def upload_mod(server_id):
 @bp.route('/api/server/<int:server_id>/mods/replace', methods=['POST'])
 @login_required
 @require_permission('manage_configs')
+@_require_server_access
 def replace_mod(server_id):
-    server = Server.get_by_id(server_id)
-    if not server:
-        return jsonify({'success': False, 'error': 'Server not found'}), 404
-    if not _has_server_access(server_id):
-        return jsonify({'success': False, 'error': 'Forbidden'}), 403
-
     old_file = _normalize_mod_filename(request.form.get('old_file', ''))
     if not old_file or not _is_allowed_mod_filename(old_file):
         return jsonify({'success': False, 'error': 'Invalid original file'}), 400
@@ -2095,7 +2481,7 @@ def replace_mod(server_id):
     if not os.path.exists(old_path):
         return jsonify({'success': False, 'error': 'Original file not found'}), 404
 
-    manifest = _load_mod_manifest(server_id)
+    manifest = _get_mod_manifest(server_id)
     manifest_entry = None
     for entry in manifest.get('mods', []):
         if entry.get('file_name') == old_file:
@@ -2112,17 +2498,22 @@ def replace_mod(server_id):
         upload.save(destination)
         if old_path != destination and os.path.exists(old_path):
             os.remove(old_path)
-    except Exception as exc:
-        print(f"Error replacing mod for server {server_id}: {exc}")
+    except Exception:
+        log.exception("Error replacing mod for server %s", server_id)
         return jsonify({'success': False, 'error': 'Update failed'}), 500
 
     if manifest_entry and not manifest_entry.get('mod_id'):
-        manifest_entry['file_name'] = new_file
-        manifest_entry['file_length'] = os.path.getsize(destination)
-        manifest_entry['installed_at'] = _iso_now()
-        manifest_entry['updated_at'] = _iso_now()
-        manifest_entry['restart_required'] = True
-        _save_mod_manifest(server_id, manifest)
+        file_length = os.path.getsize(destination)
+        now = _iso_now()
+        with _manifest_txn(server_id) as current:
+            for entry in current.get('mods', []):
+                if entry.get('file_name') == old_file and not entry.get('mod_id'):
+                    entry['file_name'] = new_file
+                    entry['file_length'] = file_length
+                    entry['installed_at'] = now
+                    entry['updated_at'] = now
+                    entry['restart_required'] = True
+                    break
 
     return jsonify({'success': True, 'file_name': new_file})
 
@@ -2130,15 +2521,9 @@ def replace_mod(server_id):
 @bp.route('/api/server/<int:server_id>/mods/installed')
 @login_required
 @require_permission('manage_configs')
+@_require_server_access
 def list_installed_mods(server_id):
-    server = Server.get_by_id(server_id)
-    if not server:
-        return jsonify({'success': False, 'error': 'Server not found'}), 404
-    if not _has_server_access(server_id):
-        return jsonify({'success': False, 'error': 'Forbidden'}), 403
-
     mods_dir = _get_mods_dir(server_id)
-    manifest = _load_mod_manifest(server_id)
     updated_mods = []
     update_error = None
 
@@ -2151,26 +2536,35 @@ def list_installed_mods(server_id):
                 updated_mods, update_error = apply_auto_updates_for_server(server_id)
             except Exception as exc:
                 update_error = str(exc)
+    # Read after the update check so its changes are included
+    manifest = _get_mod_manifest(server_id)
     manifest_map = {item.get('file_name'): item for item in manifest.get('mods', [])}
     results = []
 
-    if os.path.isdir(mods_dir):
-        for filename in sorted(os.listdir(mods_dir)):
-            if not (filename.endswith('.jar') or filename.endswith('.zip')):
-                continue
-            file_path = os.path.join(mods_dir, filename)
-            entry = manifest_map.get(filename, {}).copy()
-            entry.setdefault('file_name', filename)
-            entry.setdefault('name', filename)
-            entry.setdefault('summary', filename)
-            entry.setdefault('auto_update', False)
-            entry.setdefault('restart_required', False)
-            entry.setdefault('local', not entry.get('mod_id'))
-            entry['file_length'] = os.path.getsize(file_path)
-            entry.setdefault('installed_at', datetime.datetime.utcfromtimestamp(
-                os.path.getmtime(file_path)
-            ).replace(microsecond=0).isoformat() + 'Z')
-            results.append(entry)
+    try:
+        with os.scandir(mods_dir) as it:
+            mod_files = [item for item in it if item.name.endswith(MOD_FILE_EXTENSIONS)]
+    except (FileNotFoundError, NotADirectoryError):
+        mod_files = []
+    mod_files.sort(key=lambda item: item.name)
+
+    for mod_file in mod_files:
+        filename = mod_file.name
+        try:
+            st = mod_file.stat()
+        except OSError:
+            continue
+        entry = manifest_map.get(filename, {}).copy()
+        entry.setdefault('file_name', filename)
+        entry.setdefault('name', filename)
+        entry.setdefault('summary', filename)
+        entry.setdefault('auto_update', False)
+        entry.setdefault('restart_required', False)
+        entry.setdefault('local', not entry.get('mod_id'))
+        entry['file_length'] = st.st_size
+        if 'installed_at' not in entry:
+            entry['installed_at'] = time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(int(st.st_mtime)))
+        results.append(entry)
 
     return jsonify({
         'success': True,
@@ -2183,46 +2577,35 @@ def list_installed_mods(server_id):
 @bp.route('/api/server/<int:server_id>/mods/auto-update', methods=['POST'])
 @login_required
 @require_permission('manage_configs')
+@_require_server_access
 def set_mod_auto_update(server_id):
-    server = Server.get_by_id(server_id)
-    if not server:
-        return jsonify({'success': False, 'error': 'Server not found'}), 404
-    if not _has_server_access(server_id):
-        return jsonify({'success': False, 'error': 'Forbidden'}), 403
-
     payload = request.get_json(silent=True) or {}
     file_name = payload.get('file_name')
     auto_update = bool(payload.get('auto_update', False))
     if not file_name:
         return jsonify({'success': False, 'error': 'Missing file name'}), 400
 
-    manifest = _load_mod_manifest(server_id)
-    updated = False
-    for entry in manifest.get('mods', []):
-        if entry.get('file_name') == file_name:
-            if not entry.get('mod_id'):
-                return jsonify({'success': False, 'error': 'Auto-update requires a CurseForge-installed mod'}), 400
-            entry['auto_update'] = auto_update
-            updated = True
-            break
+    found = None
+    with _manifest_txn(server_id) as manifest:
+        for entry in manifest.get('mods', []):
+            if entry.get('file_name') == file_name:
+                found = entry
+                if entry.get('mod_id'):
+                    entry['auto_update'] = auto_update
+                break
 
-    if not updated:
+    if found is None:
         return jsonify({'success': False, 'error': 'Mod not found in manifest'}), 404
-
-    _save_mod_manifest(server_id, manifest)
+    if not found.get('mod_id'):
+        return jsonify({'success': False, 'error': 'Auto-update requires a CurseForge-installed mod'}), 400
     return jsonify({'success': True})
 
 
 @bp.route('/api/server/<int:server_id>/mods/uninstall', methods=['POST'])
 @login_required
 @require_permission('manage_configs')
+@_require_server_access
 def uninstall_mod(server_id):
-    server = Server.get_by_id(server_id)
-    if not server:
-        return jsonify({'success': False, 'error': 'Server not found'}), 404
-    if not _has_server_access(server_id):
-        return jsonify({'success': False, 'error': 'Forbidden'}), 403
-
     payload = request.get_json(silent=True) or {}
     file_name = payload.get('file_name')
     if not file_name:
@@ -2231,15 +2614,16 @@ def uninstall_mod(server_id):
     mods_dir = _get_mods_dir(server_id)
     safe_name = _sanitize_filename(file_name, file_name)
     file_path = os.path.join(mods_dir, safe_name)
-    if os.path.exists(file_path):
+    try:
         os.remove(file_path)
+    except FileNotFoundError:
+        pass
 
-    manifest = _load_mod_manifest(server_id)
-    manifest['mods'] = [
-        item for item in manifest.get('mods', [])
-        if item.get('file_name') != safe_name
-    ]
-    _save_mod_manifest(server_id, manifest)
+    with _manifest_txn(server_id) as manifest:
+        manifest['mods'] = [
+            item for item in manifest.get('mods', [])
+            if item.get('file_name') != safe_name
+        ]
 
     return jsonify({'success': True})
 
@@ -2247,13 +2631,8 @@ def uninstall_mod(server_id):
 @bp.route('/api/server/<int:server_id>/mods/check-updates', methods=['POST'])
 @login_required
 @require_permission('manage_configs')
+@_require_server_access
 def check_mod_updates(server_id):
-    server = Server.get_by_id(server_id)
-    if not server:
-        return jsonify({'success': False, 'error': 'Server not found'}), 404
-    if not _has_server_access(server_id):
-        return jsonify({'success': False, 'error': 'Forbidden'}), 403
-
     try:
         updated_mods, error = apply_auto_updates_for_server(server_id)
         if error:
@@ -74,13 +74,14 @@ socket.on('connect', () => {
     socket.emit('join_console', { server_id: SERVER_ID });
     checkAuthStatus();
     startAuthPolling();
+    // join_console sends the backlog; new lines are pushed via console_output
     stopConsolePolling();
-    startConsolePolling();
     checkModUpdates();
 });
 
 socket.on('disconnect', () => {
     console.log('Disconnected from server');
+    // Fall back to HTTP polling until the socket reconnects
     startConsolePolling();
 });
 
@@ -800,17 +801,5 @@ if (!IS_RUNNING) {
     restartBtn.style.display = 'inline-flex';
 }
 
-// Poll server status periodically
-setInterval(async () => {
-    try {
-        const response = await fetch(`/api/server/${SERVER_ID}/status`);
-        if (response.ok) {
-            const data = await response.json();
-            if (data.success) {
-                updateStatus(data.status, data.is_running);
-            }
-        }
-    } catch (error) {
-        console.error('Status poll error:', error);
-    }
-}, 5000);
+// Status updates arrive via server_status (sent on join_console, including
+// reconnects) and server_status_change, so no periodic polling is needed.
@@ -331,6 +331,20 @@ function openModalFromHash() {
 
 openModalFromHash();
 
+const UPDATE_STATUS_POLL_MS = 1000;
+
+async function waitForUpdateJob() {
+    while (true) {
+        await new Promise(resolve => setTimeout(resolve, UPDATE_STATUS_POLL_MS));
+        const response = await fetch('/api/system/update/status', { cache: 'no-store' });
+        const state = await response.json();
+        if (['done', 'failed', 'restarting', 'idle'].includes(state.phase)) {
+            return state;
+        }
+        updateDetailText.textContent = state.message || '';
+    }
+}
+
 async function runUpdate(mode) {
     if (!updateModal) return;
     if (checkUpdateBtn) checkUpdateBtn.disabled = true;
@@ -350,18 +364,25 @@ async function runUpdate(mode) {
         if (!data.success) {
             updateStatusText.textContent = 'Update failed.';
             updateDetailText.textContent = data.error || 'Unknown error';
-        } else if (mode === 'check') {
-            updateStatusText.textContent = data.updated ? 'Updates installed.' : 'Update check completed.';
-            updateDetailText.textContent = data.message || '';
-        } else if (!data.updated) {
-            updateStatusText.textContent = 'No updates available.';
-            updateDetailText.textContent = '';
-        } else {
+            return;
+        }
+
+        const state = await waitForUpdateJob();
+        if (state.phase === 'failed') {
+            updateStatusText.textContent = 'Update failed.';
+            updateDetailText.textContent = state.error || 'Unknown error';
+        } else if (state.phase === 'restarting') {
             updateStatusText.textContent = 'Update installed. Restarting web interface...';
             updateDetailText.textContent = 'Redirecting to restart screen...';
             setTimeout(() => {
                 window.location.href = '/system/restarting';
             }, 800);
+        } else if (mode === 'check') {
+            updateStatusText.textContent = 'Update check completed.';
+            updateDetailText.textContent = state.message || '';
+        } else {
+            updateStatusText.textContent = 'No updates available.';
+            updateDetailText.textContent = '';
         }
     } catch (error) {
         updateStatusText.textContent = 'Update failed.';
@@ -856,6 +877,9 @@ function startDownloadFlow() {
             console.log('Download API response:', data);
             if (data.success) {
                 startDownloadPolling();
+            } else if (data.already_running) {
+                addDownloadMessage('A download is already running, showing its progress...');
+                startDownloadPolling();
             } else {
                 addDownloadMessage(data.error || 'Failed to start download', 'error');
             }
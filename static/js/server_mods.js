@@ -324,8 +324,48 @@ function renderModFiles(files, serverVersion) {
     });
 }
 
+const installSocket = window.hsmSocket || io();
+window.hsmSocket = installSocket;
+const installJobWaiters = new Map();
+
+// Progress is only sent to the server's mods room
+const joinModsRoom = () => installSocket.emit('join_mods', { server_id: SERVER_ID });
+installSocket.on('connect', joinModsRoom);
+if (installSocket.connected) joinModsRoom();
+
+installSocket.on('mod_install_progress', (job) => {
+    const waiter = installJobWaiters.get(job.job_id);
+    if (waiter) waiter(job);
+});
+
+function waitForInstallJob(jobId) {
+    // Completion is pushed over Socket.IO; a slow poll covers missed events.
+    return new Promise((resolve) => {
+        let poller = null;
+        const finish = (job) => {
+            if (job.state !== 'done' && job.state !== 'failed') return;
+            installJobWaiters.delete(jobId);
+            clearInterval(poller);
+            resolve(job);
+        };
+        installJobWaiters.set(jobId, finish);
+        poller = setInterval(async () => {
+            try {
+                const response = await fetch(`/api/server/${SERVER_ID}/mods/install/${jobId}`);
+                if (!response.ok) return;
+                const data = await response.json();
+                if (data.success) finish(data);
+            } catch (error) {
+                // Keep waiting; the next poll or socket event will resolve it.
+            }
+        }, 5000);
+    });
+}
+
 async function installSelectedFile() {
     if (!activeModId || !selectedFileId) return;
+    const installName = activeModName;
+    const installButton = activeInstallButton;
     modalInstallBtn.disabled = true;
     modalInstallBtn.textContent = 'Installing...';
     try {
@@ -364,11 +404,18 @@ async function installSelectedFile() {
             modalInstallBtn.textContent = 'Install selected';
             return;
         }
-        showToast(`Installed ${activeModName}.`);
-        if (activeInstallButton) {
-            activeInstallButton.className = 'btn btn-ghost';
-            activeInstallButton.textContent = 'Installiert';
-            activeInstallButton.disabled = true;
+        const job = await waitForInstallJob(data.job_id);
+        if (job.state === 'failed') {
+            showToast(job.error || 'Install failed.', 'error');
+            modalInstallBtn.disabled = false;
+            modalInstallBtn.textContent = 'Install selected';
+            return;
+        }
+        showToast(`Installed ${installName}.`);
+        if (installButton) {
+            installButton.className = 'btn btn-ghost';
+            installButton.textContent = 'Installiert';
+            installButton.disabled = true;
         }
         modal.classList.remove('active');
         modalInstallBtn.textContent = 'Install selected';
@@ -29,7 +29,7 @@ socket.on('server_status', (data) => {
     applyStatus(data.status);
 });
 
-setInterval(async () => {
+async function refreshStatus() {
     try {
         const response = await fetch(`/api/server/${SERVER_ID}/status`);
         if (!response.ok) return;
@@ -39,9 +39,16 @@ setInterval(async () => {
             applyStatus(resolved);
         }
     } catch (error) {
-        console.error('Status poll error:', error);
+        console.error('Status refresh error:', error);
     }
-}, 5000);
+}
+
+// Changes are pushed via server_status_change; resync once per (re)connect
+// to catch anything missed while the socket was down.
+socket.on('connect', refreshStatus);
+if (socket.connected) {
+    refreshStatus();
+}
 
 function insertGotaleAlert() {
     const main = document.querySelector('.server-main');
@@ -3,17 +3,28 @@ Authorization helpers for role-based permissions.
 """
 
 from functools import wraps
-from flask import request, jsonify, render_template
+from flask import request, jsonify, render_template, g
 from flask_login import current_user
 from models.user import User
 
 
+def get_user_permissions():
+    """
+    Return the current user's permission keys as a frozenset, loaded with a
+    single query and kept on flask.g for the rest of the request.
+    """
+    permissions = g.get('_permission_set')
+    if permissions is None:
+        permissions = g._permission_set = frozenset(User.get_permissions(current_user.id))
+    return permissions
+
+
 def has_permission(permission_key):
     if not current_user.is_authenticated:
         return False
     if current_user.is_superadmin:
         return True
-    return User.has_permission(current_user.id, permission_key)
+    return permission_key in get_user_permissions()
 
 
 def require_permission(permission_key):
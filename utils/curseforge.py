@@ -2,19 +2,88 @@
 CurseForge API helpers.
 """
 
+import http.client
 import json
+import os
+import threading
+import time
 import urllib.parse
 import urllib.request
 import urllib.error
 import shutil
 
 API_BASE = "https://api.curseforge.com/v1"
+_API_URL = urllib.parse.urlsplit(API_BASE)
+
+# Errors that mean a kept-alive connection was dropped by the server and the
+# request can safely be sent again on a fresh one.
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.CannotSendRequest,
+    ConnectionResetError,
+    BrokenPipeError,
+)
+
+_local = threading.local()
+
+
+def _api_connection(timeout):
+    """Return this thread's keep-alive HTTPS connection to the API host."""
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        conn = _local.conn = http.client.HTTPSConnection(_API_URL.netloc, timeout=timeout)
+    else:
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+    return conn
+
+
+def _drop_api_connection():
+    conn = getattr(_local, "conn", None)
+    _local.conn = None
+    if conn is not None:
+        conn.close()
+
+
+def _api_get(path, headers, timeout):
+    """GET over the kept-alive connection; returns (status, reason, headers, body)."""
+    for attempt in range(2):
+        conn = _api_connection(timeout)
+        try:
+            conn.request("GET", path, headers=headers)
+            response = conn.getresponse()
+            return response.status, response.reason, response.headers, response.read()
+        except _STALE_CONNECTION_ERRORS:
+            _drop_api_connection()
+            if attempt:
+                raise
+        except BaseException:
+            _drop_api_connection()
+            raise
+
+
+def _fetch_json(endpoint, api_key, query, timeout):
+    """Return (data, error, Cache-Control header) for one API GET."""
+    if not urllib.request.getproxies().get("https"):
+        # Reuse one TLS connection per thread instead of a new handshake per call
+        headers = {"Accept": "application/json", "x-api-key": api_key}
+        try:
+            status, reason, response_headers, body = _api_get(
+                f"{_API_URL.path}{endpoint}{query}", headers, timeout
+            )
+        except Exception as exc:
+            return None, str(exc), None
+        if status >= 400:
+            error_payload = body.decode("utf-8", "replace")
+            return None, f"HTTP {status} {reason} {error_payload}".strip(), None
+        try:
+            return json.loads(body), None, response_headers.get("Cache-Control")
+        except Exception as exc:
+            return None, str(exc), None
 
-
-def _request_json(endpoint, api_key, params=None, timeout=20):
-    url = f"{API_BASE}{endpoint}"
-    if params:
-        url = f"{url}?{urllib.parse.urlencode(params)}"
+    # urllib honours the configured HTTPS proxy
+    url = f"{API_BASE}{endpoint}{query}"
     req = urllib.request.Request(
         url,
         headers={
@@ -25,19 +94,72 @@ def _request_json(endpoint, api_key, params=None, timeout=20):
     try:
         with urllib.request.urlopen(req, timeout=timeout) as response:
             data = response.read().decode("utf-8")
-            return json.loads(data), None
+            return json.loads(data), None, response.headers.get("Cache-Control")
     except urllib.error.HTTPError as exc:
         try:
             error_payload = exc.read().decode("utf-8")
         except Exception:
             error_payload = ""
-        return None, f"HTTP {exc.code} {exc.reason} {error_payload}".strip()
+        return None, f"HTTP {exc.code} {exc.reason} {error_payload}".strip(), None
     except Exception as exc:
-        return None, str(exc)
+        return None, str(exc), None
+
+
+# Read-only metadata barely changes minute to minute, so successful GETs are
+# kept in memory. Searches expire sooner so new uploads show up quickly.
+RESPONSE_CACHE_TTL = 300
+SEARCH_CACHE_TTL = 60
+RESPONSE_CACHE_MAX_ENTRIES = 512
+_response_cache = {}
+_response_cache_lock = threading.Lock()
+
+
+def _cache_ttl(cache_control, ttl):
+    """Shorten ttl to the server's max-age; no-store disables caching."""
+    if not cache_control:
+        return ttl
+    for directive in cache_control.lower().split(","):
+        name, _, value = directive.strip().partition("=")
+        if name == "no-store":
+            return 0
+        if name == "max-age":
+            try:
+                return min(ttl, int(value.strip('"')))
+            except ValueError:
+                pass
+    return ttl
+
+
+def _request_json(endpoint, api_key, params=None, timeout=20, ttl=RESPONSE_CACHE_TTL):
+    query = f"?{urllib.parse.urlencode(params)}" if params else ""
+    if not ttl:
+        data, error, _ = _fetch_json(endpoint, api_key, query, timeout)
+        return data, error
+
+    key = (endpoint, query, api_key)
+    now = time.monotonic()
+    with _response_cache_lock:
+        cached = _response_cache.get(key)
+        if cached and cached[0] > now:
+            return cached[1], None
+
+    data, error, cache_control = _fetch_json(endpoint, api_key, query, timeout)
+    ttl = _cache_ttl(cache_control, ttl)
+    if error or data is None or ttl <= 0:
+        return data, error
+
+    with _response_cache_lock:
+        if key not in _response_cache and len(_response_cache) >= RESPONSE_CACHE_MAX_ENTRIES:
+            for stale_key in [k for k, v in _response_cache.items() if v[0] <= now]:
+                del _response_cache[stale_key]
+            if len(_response_cache) >= RESPONSE_CACHE_MAX_ENTRIES:
+                _response_cache.pop(next(iter(_response_cache)))
+        _response_cache[key] = (now + ttl, data)
+    return data, None
 
 
 def search_mods(api_key, params):
-    return _request_json("/mods/search", api_key, params=params)
+    return _request_json("/mods/search", api_key, params=params, ttl=SEARCH_CACHE_TTL)
 
 
 def get_mod(api_key, mod_id):
@@ -53,10 +175,25 @@ def get_mod_file(api_key, mod_id, file_id):
 
 
 def get_download_url(api_key, mod_id, file_id):
-    return _request_json(f"/mods/{mod_id}/files/{file_id}/download-url", api_key)
+    # Download URLs may be short-lived signed links, so they are never cached
+    return _request_json(f"/mods/{mod_id}/files/{file_id}/download-url", api_key, ttl=0)
+
+
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
 
 
 def download_file(url, destination, timeout=60):
+    # Stream in 1 MiB chunks to a temporary file and move it into place, so an
+    # interrupted download never leaves a truncated jar at `destination`.
+    temp_path = f"{destination}.part"
     req = urllib.request.Request(url, headers={"Accept": "*/*"})
-    with urllib.request.urlopen(req, timeout=timeout) as response, open(destination, "wb") as handle:
-        shutil.copyfileobj(response, handle)
+    try:
+        with urllib.request.urlopen(req, timeout=timeout) as response, open(temp_path, "wb") as handle:
+            shutil.copyfileobj(response, handle, DOWNLOAD_CHUNK_SIZE)
+        os.replace(temp_path, destination)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
@@ -0,0 +1,91 @@
+"""
+Per-thread SQLite connection reuse.
+
+Opening a connection costs a file open plus schema and WAL header reads, and
+the models used to pay that on every call. connect() hands out a wrapper
+around one long-lived connection per thread and database file instead. Its
+close() only resets the connection so the next caller starts clean.
+The connections are closed when their thread exits and its thread-local
+storage is freed.
+"""
+
+import sqlite3
+import threading
+import weakref
+
+CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+)
+
+_local = threading.local()
+
+
+def get_connection(db_path, pragmas=CONNECTION_PRAGMAS):
+    """Return this thread's persistent connection for db_path."""
+    connections = getattr(_local, 'connections', None)
+    if connections is None:
+        connections = _local.connections = {}
+    conn = connections.get(db_path)
+    if conn is None:
+        conn = sqlite3.connect(db_path)
+        for pragma in pragmas:
+            conn.execute(pragma)
+        connections[db_path] = conn
+    return conn
+
+
+class PooledConnection:
+    """
+    Stand-in for sqlite3.Connection as used by the models. close() rolls back
+    anything left uncommitted and restores the default row factory rather
+    than closing the shared connection.
+    """
+
+    __slots__ = ('_conn', '_closed', '__weakref__')
+
+    def __init__(self, conn):
+        object.__setattr__(self, '_conn', conn)
+        object.__setattr__(self, '_closed', False)
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+    def __setattr__(self, name, value):
+        setattr(self._conn, name, value)
+
+    def close(self):
+        if not self._closed:
+            object.__setattr__(self, '_closed', True)
+            _reset(self._conn)
+
+
+def _reset(conn):
+    if conn.in_transaction:
+        conn.rollback()
+    conn.row_factory = None
+
+
+def connect(db_path):
+    """Drop-in replacement for sqlite3.connect() that reuses the thread's connection."""
+    owners = getattr(_local, 'owners', None)
+    if owners is None:
+        owners = _local.owners = {}
+    owner_ref = owners.get(db_path)
+    owner = owner_ref() if owner_ref is not None else None
+    if owner is not None and not owner._closed:
+        # Someone up the stack still has the shared connection open; give
+        # this caller its own, as sqlite3.connect() would, instead of
+        # touching the outer caller's transaction.
+        return sqlite3.connect(db_path)
+
+    conn = get_connection(db_path)
+    if owner_ref is not None and owner is None:
+        # The previous wrapper was dropped without close() (its caller
+        # raised), so nobody can still commit what it left behind.
+        _reset(conn)
+    wrapper = PooledConnection(conn)
+    owners[db_path] = weakref.ref(wrapper)
+    return wrapper
@@ -15,18 +15,21 @@ PERMISSIONS = [
     ('manage_settings', 'Manage system settings'),
 ]
 
+DEFAULT_SETTINGS = (
+    ('curseforge_api_key', ''),
+    ('curseforge_game_id', '70216'),
+    ('mod_auto_update_interval_hours', '6'),
+)
 
-def _table_exists(cursor, name):
-    cursor.execute(
-        "SELECT name FROM sqlite_master WHERE type='table' AND name = ?",
-        (name,),
-    )
-    return cursor.fetchone() is not None
+
+def _table_names(cursor):
+    cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
+    return {row[0] for row in cursor.fetchall()}
 
 
-def _column_exists(cursor, table_name, column_name):
+def _column_names(cursor, table_name):
     cursor.execute(f"PRAGMA table_info({table_name})")
-    return any(row[1] == column_name for row in cursor.fetchall())
+    return {row[1] for row in cursor.fetchall()}
 
 
 def ensure_schema(db_path):
@@ -34,7 +37,17 @@ def ensure_schema(db_path):
     conn = sqlite3.connect(db_path)
     cursor = conn.cursor()
 
-    if not _table_exists(cursor, 'roles'):
+    # WAL is persistent for the database file, so it only needs to be set once.
+    try:
+        cursor.execute('PRAGMA journal_mode=WAL')
+    except sqlite3.Error as e:
+        print(f"Could not enable WAL journal mode: {e}")
+
+    # One catalog read up front instead of a lookup per table/column
+    tables = _table_names(cursor)
+    user_columns = _column_names(cursor, 'users')
+
+    if 'roles' not in tables:
         cursor.execute('''
             CREATE TABLE roles (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -44,7 +57,7 @@ def ensure_schema(db_path):
             )
         ''')
 
-    if not _table_exists(cursor, 'permissions'):
+    if 'permissions' not in tables:
         cursor.execute('''
             CREATE TABLE permissions (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -53,7 +66,7 @@ def ensure_schema(db_path):
             )
         ''')
 
-    if not _table_exists(cursor, 'role_permissions'):
+    if 'role_permissions' not in tables:
         cursor.execute('''
             CREATE TABLE role_permissions (
                 role_id INTEGER NOT NULL,
@@ -64,7 +77,7 @@ def ensure_schema(db_path):
             )
         ''')
 
-    if not _table_exists(cursor, 'user_roles'):
+    if 'user_roles' not in tables:
         cursor.execute('''
             CREATE TABLE user_roles (
                 user_id INTEGER NOT NULL,
@@ -75,19 +88,19 @@ def ensure_schema(db_path):
             )
         ''')
 
-    if not _column_exists(cursor, 'users', 'must_change_password'):
+    if 'must_change_password' not in user_columns:
         cursor.execute('''
             ALTER TABLE users
             ADD COLUMN must_change_password BOOLEAN DEFAULT 0
         ''')
 
-    if not _column_exists(cursor, 'users', 'all_servers_access'):
+    if 'all_servers_access' not in user_columns:
         cursor.execute('''
             ALTER TABLE users
             ADD COLUMN all_servers_access BOOLEAN DEFAULT 0
         ''')
 
-    if not _table_exists(cursor, 'user_server_access'):
+    if 'user_server_access' not in tables:
         cursor.execute('''
             CREATE TABLE user_server_access (
                 user_id INTEGER NOT NULL,
@@ -98,7 +111,7 @@ def ensure_schema(db_path):
             )
         ''')
 
-    if not _table_exists(cursor, 'server_webhooks'):
+    if 'server_webhooks' not in tables:
         cursor.execute('''
             CREATE TABLE server_webhooks (
                 server_id INTEGER NOT NULL,
@@ -110,13 +123,13 @@ def ensure_schema(db_path):
                 FOREIGN KEY (server_id) REFERENCES servers(id) ON DELETE CASCADE
             )
         ''')
-    elif not _column_exists(cursor, 'server_webhooks', 'template'):
+    elif 'template' not in _column_names(cursor, 'server_webhooks'):
         cursor.execute('''
             ALTER TABLE server_webhooks
             ADD COLUMN template TEXT DEFAULT ''
         ''')
 
-    if not _table_exists(cursor, 'gotale_events'):
+    if 'gotale_events' not in tables:
         cursor.execute('''
             CREATE TABLE gotale_events (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -131,33 +144,15 @@ def ensure_schema(db_path):
         ''')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_gotale_events_server_time ON gotale_events (server_id, created_at)')
 
-    for key, description in PERMISSIONS:
-        cursor.execute(
-            '''
-            INSERT OR IGNORE INTO permissions (key, description)
-            VALUES (?, ?)
-            ''',
-            (key, description),
-        )
+    cursor.executemany(
+        'INSERT OR IGNORE INTO permissions (key, description) VALUES (?, ?)',
+        PERMISSIONS,
+    )
 
-    if _table_exists(cursor, 'settings'):
-        cursor.execute(
-            '''
-            INSERT OR IGNORE INTO settings (key, value)
-            VALUES ('curseforge_api_key', '')
-            '''
-        )
-        cursor.execute(
-            '''
-            INSERT OR IGNORE INTO settings (key, value)
-            VALUES ('curseforge_game_id', '70216')
-            '''
-        )
-        cursor.execute(
-            '''
-            INSERT OR IGNORE INTO settings (key, value)
-            VALUES ('mod_auto_update_interval_hours', '6')
-            '''
+    if 'settings' in tables:
+        cursor.executemany(
+            'INSERT OR IGNORE INTO settings (key, value) VALUES (?, ?)',
+            DEFAULT_SETTINGS,
         )
 
     conn.commit()
@@ -5,8 +5,31 @@ Checks if Java 25 or higher is installed
 
 import subprocess
 import re
+import threading
+import time
+
+# Java installations do not change between requests, so the (forking)
+# version probe is cached for a short time.
+JAVA_CHECK_TTL = 60
+_java_cache = {'checked_at': 0.0, 'result': None}
+_java_cache_lock = threading.Lock()
 
 def check_java():
+    """
+    Check if Java is installed and get version information (cached)
+
+    Returns:
+        dict: see _probe_java(); callers receive their own copy
+    """
+    with _java_cache_lock:
+        result = _java_cache['result']
+        if result is None or time.monotonic() - _java_cache['checked_at'] >= JAVA_CHECK_TTL:
+            result = _probe_java()
+            _java_cache['result'] = result
+            _java_cache['checked_at'] = time.monotonic()
+    return dict(result)
+
+def _probe_java():
     """
     Check if Java is installed and get version information
 
@@ -0,0 +1,73 @@
+"""
+Fast JSON support for API responses and JSON files.
+
+Uses orjson when it is installed and falls back to Flask's default
+(stdlib json) provider / the json module otherwise.
+"""
+
+import json
+
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider that serializes with orjson."""
+
+    def dumps(self, obj, **kwargs):
+        option = orjson.OPT_NON_STR_KEYS
+        if kwargs.get('sort_keys', self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, default=self.default, option=option).decode('utf-8')
+        except TypeError:
+            # Types orjson cannot handle (e.g. sets) keep the stdlib behaviour
+            return super().dumps(obj, **kwargs)
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        """Build jsonify() responses straight from orjson's bytes output."""
+        obj = self._prepare_response_obj(args, kwargs)
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            body = orjson.dumps(obj, default=self.default, option=option)
+        except TypeError:
+            return super().response(*args, **kwargs)
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+
+def init_app(app):
+    """Install the orjson provider on the app if orjson is available."""
+    if orjson is not None:
+        app.json = ORJSONProvider(app)
+
+
+def loads(data):
+    """Parse JSON from bytes or str."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except ValueError:
+            # e.g. UTF-8 BOM or UTF-16 files, which the json module accepts
+            pass
+    return json.loads(data)
+
+
+def dumps_pretty(data):
+    """Serialize to indented, newline-terminated UTF-8 bytes for files."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+        except TypeError:
+            pass
+    return (json.dumps(data, indent=2, ensure_ascii=True) + '\n').encode('utf-8')
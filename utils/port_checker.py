@@ -27,6 +27,31 @@ def is_port_available(port, host='0.0.0.0'):
     except Exception:
         return False
 
+def get_bound_udp_ports():
+    """
+    Get all locally bound UDP ports in one pass (Linux only)
+
+    Reads /proc/net/udp and /proc/net/udp6 instead of probing ports one by
+    one with bind().
+
+    Returns:
+        set or None: Bound port numbers, or None if the tables are unavailable
+    """
+    ports = set()
+    found = False
+    for table in ('/proc/net/udp', '/proc/net/udp6'):
+        try:
+            with open(table, 'r') as handle:
+                next(handle, None)
+                for line in handle:
+                    fields = line.split()
+                    if len(fields) > 1:
+                        ports.add(int(fields[1].rsplit(':', 1)[1], 16))
+            found = True
+        except (OSError, ValueError, IndexError):
+            continue
+    return ports if found else None
+
 def get_next_available_port(start_port=5520, max_attempts=1000):
     """
     Find the next available port starting from start_port
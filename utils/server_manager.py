@@ -15,6 +15,9 @@ import sys
 import json
 import uuid
 from queue import Queue, Empty
+from collections import deque
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
 
 # Supported persistence types to try in order if the server rejects one.
@@ -25,26 +28,61 @@ AUTH_PERSISTENCE_TYPES = [
 # Global dictionary to store running server processes
 _running_servers = {}
 
-# Global dictionary to store console output buffers
+# Global dictionary to store console output buffers (bounded deques)
 _console_buffers = {}
 
+# Directory holding the per-server folders (server_<id>)
+SERVERS_DIR = os.path.join(Path(__file__).parent.parent.parent, 'servers')
+
 # Maximum lines to keep in console buffer
 MAX_BUFFER_LINES = 1000
 
+# Monotonic counter bumped on every download status change (used as ETag)
+_status_version = 0
+
+# Generated once per process so versions from before a restart never match
+_BOOT_ID = uuid.uuid4().hex
+
+
+def _bump_status_version():
+    global _status_version
+    _status_version += 1
+
+
+class _StatusMessages(list):
+    """Message list that bumps the download status version when appended to."""
+
+    def append(self, item):
+        super().append(item)
+        _bump_status_version()
+
+
+class _DownloadStatus(dict):
+    """Download status dict that bumps the status version on every write."""
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        _bump_status_version()
+
+
+def _new_download_status(active=False):
+    return _DownloadStatus({
+        'active': active,
+        'auth_url': None,
+        'auth_code': None,
+        'percentage': None,
+        'details': None,
+        'messages': _StatusMessages(),
+        'complete': False,
+        'success': False,
+        'attempt': 0,
+        'max_attempts': 0,
+        'last_error': None
+    })
+
+
 # Global variable to store download status (for polling)
-_download_status = {
-    'active': False,
-    'auth_url': None,
-    'auth_code': None,
-    'percentage': None,
-    'details': None,
-    'messages': [],
-    'complete': False,
-    'success': False,
-    'attempt': 0,
-    'max_attempts': 0,
-    'last_error': None
-}
+_download_status = _new_download_status()
 
 VERSION_FILENAME = 'hytale_version.txt'
 
@@ -86,13 +124,24 @@ DEFAULT_STARTUP_SETTINGS = {
     'crash_auto_restart': False
 }
 
+# path -> ((mtime_ns, size), version); avoids re-reading unchanged version files
+_version_file_cache = {}
+
 def _read_version_file(path):
-    if not os.path.exists(path):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        _version_file_cache.pop(path, None)
         return None
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cached = _version_file_cache.get(path)
+    if cached and cached[0] == stamp:
+        return cached[1]
     try:
         with open(path, 'r', encoding='utf-8') as handle:
-            version = handle.read().strip()
-        return version or None
+            version = handle.read().strip() or None
+        _version_file_cache[path] = (stamp, version)
+        return version
     except Exception as e:
         print(f"Error reading version file {path}: {e}")
         return None
@@ -117,6 +166,27 @@ def get_server_version(server_id):
     version_path = os.path.join(get_server_path(server_id), VERSION_FILENAME)
     return _read_version_file(version_path)
 
+def get_server_versions_bulk(server_ids):
+    """Return {server_id: version} for the given servers in one directory pass"""
+    wanted = {f'server_{server_id}': server_id for server_id in server_ids}
+    versions = {server_id: None for server_id in wanted.values()}
+    try:
+        with os.scandir(SERVERS_DIR) as entries:
+            for entry in entries:
+                server_id = wanted.get(entry.name)
+                if server_id is None:
+                    continue
+                try:
+                    with open(os.path.join(entry.path, VERSION_FILENAME), 'r', encoding='utf-8') as handle:
+                        versions[server_id] = handle.read().strip() or None
+                except FileNotFoundError:
+                    continue
+                except Exception as e:
+                    print(f"Error reading version file for server {server_id}: {e}")
+    except FileNotFoundError:
+        pass
+    return versions
+
 def _copy_version_file(source_dir, dest_dir):
     source_path = os.path.join(source_dir, VERSION_FILENAME)
     if os.path.exists(source_path):
@@ -185,24 +255,19 @@ def get_latest_game_version(host_os=None):
 
 def get_download_status():
     """Get current download status for polling"""
-    return _download_status.copy()
+    status = dict(_download_status)
+    status['messages'] = list(status['messages'])
+    return status
+
+def get_download_status_version():
+    """Return a version string that changes whenever the download status changes"""
+    return f'{_BOOT_ID}-{_status_version}'
 
 def reset_download_status():
     """Reset download status for a new download"""
     global _download_status
-    _download_status = {
-        'active': True,
-        'auth_url': None,
-        'auth_code': None,
-        'percentage': None,
-        'details': None,
-        'messages': [],
-        'complete': False,
-        'success': False,
-        'attempt': 0,
-        'max_attempts': 0,
-        'last_error': None
-    }
+    _download_status = _new_download_status(active=True)
+    _bump_status_version()
 
 def _read_machine_id(path):
     try:
@@ -332,10 +397,10 @@ def request_auth_login(server_id, reason=None):
             print(f"[Server {server_id}] Auth login device requested ({reason})")
     return ok, None if ok else 'send_failed'
 
+@lru_cache(maxsize=1024)
 def get_server_path(server_id):
-    """Get the directory path for a server"""
-    base_path = Path(__file__).parent.parent.parent
-    return os.path.join(base_path, 'servers', f'server_{server_id}')
+    """Get the directory path for a server (stable per server_id, so memoized)"""
+    return os.path.join(SERVERS_DIR, f'server_{server_id}')
 
 def get_assets_path(server_id):
     """Get the Assets.zip path for a server"""
@@ -345,6 +410,15 @@ def get_jar_path(server_id):
     """Get the HytaleServer.jar path for a server"""
     return os.path.join(get_server_path(server_id), 'HytaleServer.jar')
 
+def has_game_files(server_id):
+    """Check for HytaleServer.jar and Assets.zip with a single directory scan"""
+    try:
+        with os.scandir(get_server_path(server_id)) as entries:
+            names = {entry.name for entry in entries}
+    except OSError:
+        return False
+    return 'HytaleServer.jar' in names and 'Assets.zip' in names
+
 def create_server_directory(server_id, name):
     """
     Create server directory structure
@@ -402,6 +476,25 @@ def ensure_gotale_plugin(server_id, force=False):
         print(f"Error copying GoTaleManager plugin: {exc}")
         return False, 'copy_failed'
 
+# ioctl request number for FICLONE (copy-on-write clone on btrfs/xfs/...)
+_FICLONE = 0x40049409
+
+def _copy_game_file(source_path, dest_path):
+    """Copy a (large) game file, cloning it on CoW filesystems when possible.
+
+    Falls back to shutil.copyfile, which uses sendfile/copy_file_range on
+    Linux. File metadata is not copied; nothing relies on it for game files.
+    """
+    if sys.platform.startswith('linux'):
+        try:
+            import fcntl
+            with open(source_path, 'rb') as src, open(dest_path, 'wb') as dst:
+                fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+            return
+        except (ImportError, OSError):
+            pass
+    shutil.copyfile(source_path, dest_path)
+
 def copy_game_files(server_id):
     """
     Copy server files to server directory
@@ -464,10 +557,10 @@ def copy_game_files(server_id):
 
         # If files found, copy them
         if source_jar and source_assets:
-            shutil.copy2(source_jar, os.path.join(server_path, 'HytaleServer.jar'))
+            _copy_game_file(source_jar, os.path.join(server_path, 'HytaleServer.jar'))
             if source_aot:
-                shutil.copy2(source_aot, os.path.join(server_path, 'HytaleServer.aot'))
-            shutil.copy2(source_assets, os.path.join(server_path, 'Assets.zip'))
+                _copy_game_file(source_aot, os.path.join(server_path, 'HytaleServer.aot'))
+            _copy_game_file(source_assets, os.path.join(server_path, 'Assets.zip'))
             if source_version_dir:
                 _copy_version_file(source_version_dir, server_path)
             _mirror_downloader_credentials(server_path)
@@ -585,8 +678,6 @@ def start_server(server_id, port, socketio=None, java_args=None, server_name=Non
             return False
 
         server_path = get_server_path(server_id)
-        jar_path = get_jar_path(server_id)
-        assets_path = get_assets_path(server_id)
         startup_settings = read_startup_settings(server_id)
 
         if startup_settings.get('automatic_update'):
@@ -594,9 +685,7 @@ def start_server(server_id, port, socketio=None, java_args=None, server_name=Non
                 print(f"Error applying automatic update for server {server_id}")
 
         # Verify files exist
-        if not os.path.exists(jar_path):
-            return False
-        if not os.path.exists(assets_path):
+        if not has_game_files(server_id):
             return False
 
         # Build Java command parts
@@ -703,7 +792,7 @@ def start_server(server_id, port, socketio=None, java_args=None, server_name=Non
                 print(f"[Server {server_id}] Failed to update auth status: {exc}")
 
         # Initialize console buffer
-        _console_buffers[server_id] = ['Starting server process...']
+        _console_buffers[server_id] = deque(['Starting server process...'], maxlen=MAX_BUFFER_LINES)
 
         # Start threads to capture output
         stdout_thread = threading.Thread(
@@ -835,27 +924,32 @@ def get_console_output(server_id, lines=100):
     Returns:
         list: List of console output lines
     """
-    if server_id in _console_buffers:
-        return _console_buffers[server_id][-lines:]
-    return []
+    buffer = _console_buffers.get(server_id)
+    if buffer is None:
+        return []
+    skip = len(buffer) - lines
+    if skip <= 0:
+        return list(buffer)
+    return list(islice(buffer, skip, None))
 
 def is_server_running(server_id):
     """Check if a server is currently running by checking the process state"""
-    if server_id not in _running_servers:
+    server_info = _running_servers.get(server_id)
+    if server_info is None:
         return False
 
-    server_info = _running_servers[server_id]
     process = server_info.get('process')
 
     if not process:
         return False
 
+    # poll() is a non-blocking waitpid, cheaper than any cache around it
     if process.poll() is None:
         return True
 
-    # Process has exited, clean up
-    if server_id in _running_servers:
-        del _running_servers[server_id]
+    # Process has exited, clean up (another thread may have done it already)
+    if _running_servers.get(server_id) is server_info:
+        _running_servers.pop(server_id, None)
 
     return False
 
@@ -979,21 +1073,18 @@ def monitor_console_output(server_id):
             clean_line = re.sub(r'\x1b\[[0-9;]*[A-Za-z]', '', line)
 
             # Add to buffer
-            if server_id in _console_buffers:
-                _console_buffers[server_id].append(clean_line)
-
-                # Trim buffer if too large
-                if len(_console_buffers[server_id]) > MAX_BUFFER_LINES:
-                    _console_buffers[server_id] = _console_buffers[server_id][-MAX_BUFFER_LINES:]
+            buffer = _console_buffers.get(server_id)
+            if buffer is not None:
+                buffer.append(clean_line)
 
-            # Broadcast to WebSocket clients
+            # Send to clients viewing this server's console
             if socketio:
                 try:
                     socketio.emit('console_output', {
                         'server_id': server_id,
                         'message': clean_line,
                         'type': stream_type
-                    })
+                    }, to=f'console_{server_id}')
                 except Exception as emit_error:
                     print(f"[WS] Error emitting console_output: {emit_error}")
 
@@ -1375,14 +1466,14 @@ def download_game_files(socketio=None, host_os=None):
         os.makedirs(template_dir, exist_ok=True)
 
         # Copy files to servertemplate
-        shutil.copy2(jar_file, os.path.join(template_dir, 'HytaleServer.jar'))
-        shutil.copy2(assets_file, os.path.join(template_dir, 'Assets.zip'))
+        _copy_game_file(jar_file, os.path.join(template_dir, 'HytaleServer.jar'))
+        _copy_game_file(assets_file, os.path.join(template_dir, 'Assets.zip'))
 
         # Also copy AOT file if it exists
         jar_dir = os.path.dirname(jar_file)
         aot_file = os.path.join(jar_dir, 'HytaleServer.aot')
         if os.path.exists(aot_file):
-            shutil.copy2(aot_file, os.path.join(template_dir, 'HytaleServer.aot'))
+            _copy_game_file(aot_file, os.path.join(template_dir, 'HytaleServer.aot'))
             print("Copied AOT cache file")
 
         if not downloaded_version:
@@ -1453,10 +1544,10 @@ def copy_downloaded_files_to_server(server_id):
             return False
 
         # Copy to server directory
-        shutil.copy2(jar_src, os.path.join(server_path, 'HytaleServer.jar'))
+        _copy_game_file(jar_src, os.path.join(server_path, 'HytaleServer.jar'))
         if os.path.exists(aot_src):
-            shutil.copy2(aot_src, os.path.join(server_path, 'HytaleServer.aot'))
-        shutil.copy2(assets_src, os.path.join(server_path, 'Assets.zip'))
+            _copy_game_file(aot_src, os.path.join(server_path, 'HytaleServer.aot'))
+        _copy_game_file(assets_src, os.path.join(server_path, 'Assets.zip'))
         _copy_version_file(template_dir, server_path)
         _mirror_downloader_credentials(server_path)
 
@@ -1667,13 +1758,12 @@ def write_backup_settings(server_id, settings):
 
 def list_worlds(server_id):
     worlds_root = os.path.join(get_server_path(server_id), 'universe', 'worlds')
-    if not os.path.isdir(worlds_root):
+    try:
+        with os.scandir(worlds_root) as entries:
+            worlds = [entry.name for entry in entries if entry.is_dir()]
+    except (FileNotFoundError, NotADirectoryError):
         return []
-    worlds = []
-    for entry in sorted(os.listdir(worlds_root)):
-        full_path = os.path.join(worlds_root, entry)
-        if os.path.isdir(full_path):
-            worlds.append(entry)
+    worlds.sort()
     return worlds
 
 def create_backup(server_id, backup_type, selected_worlds=None, update_last=False):
@@ -1743,20 +1833,25 @@ def list_backups(server_id):
     results = []
     for folder, backup_type in (('Universe', 'universe'), ('World', 'worlds'), ('Worlds', 'world')):
         folder_path = os.path.join(backup_root, folder)
-        if not os.path.isdir(folder_path):
+        try:
+            with os.scandir(folder_path) as entries:
+                archives = [entry for entry in entries if entry.name.endswith('.zip')]
+        except (FileNotFoundError, NotADirectoryError):
             continue
-        for entry in sorted(os.listdir(folder_path)):
-            if not entry.endswith('.zip'):
+        archives.sort(key=lambda entry: entry.name)
+        for entry in archives:
+            try:
+                st = entry.stat()
+            except FileNotFoundError:
                 continue
-            full_path = os.path.join(folder_path, entry)
-            label, timestamp = _parse_backup_name(entry)
+            label, timestamp = _parse_backup_name(entry.name)
             results.append({
-                'path': os.path.join(folder, entry),
+                'path': os.path.join(folder, entry.name),
                 'type': backup_type,
                 'label': label,
                 'timestamp': timestamp,
-                'created_at': os.path.getmtime(full_path),
-                'size': os.path.getsize(full_path)
+                'created_at': st.st_mtime,
+                'size': st.st_size
             })
     results.sort(key=lambda item: item['created_at'], reverse=True)
     return results
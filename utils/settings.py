@@ -3,15 +3,31 @@ Settings helpers for system settings stored in SQLite.
 """
 
 import sqlite3
+import threading
+import time
+
+from utils import db
+
+# host_os only changes during initial setup, so it is cached per process.
+_HOST_OS_CACHE = {'value': None}
+
+# Short-lived cache for hot read paths; set_setting() clears it.
+SETTINGS_CACHE_TTL = 30
+_settings_cache = {}
+_settings_cache_lock = threading.Lock()
+
+
+def _get_read_connection(db_path):
+    """Return the per-thread, PRAGMA-tuned connection used for settings reads."""
+    return db.get_connection(db_path)
 
 
 def get_setting(db_path, key, default=None):
     try:
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-        cursor.execute("SELECT value FROM settings WHERE key = ?", (key,))
+        conn = _get_read_connection(db_path)
+        cursor = conn.execute("SELECT value FROM settings WHERE key = ?", (key,))
         row = cursor.fetchone()
-        conn.close()
+        cursor.close()
         if row and row[0] is not None:
             return row[0]
     except Exception:
@@ -28,18 +44,51 @@ def set_setting(db_path, key, value):
     )
     conn.commit()
     conn.close()
+    invalidate_settings_cache()
 
 
 def get_settings(db_path, keys):
     if not keys:
         return {}
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
+    conn = _get_read_connection(db_path)
     placeholders = ",".join("?" for _ in keys)
-    cursor.execute(
+    cursor = conn.execute(
         f"SELECT key, value FROM settings WHERE key IN ({placeholders})",
         list(keys),
     )
     rows = cursor.fetchall()
-    conn.close()
+    cursor.close()
     return {row[0]: row[1] for row in rows}
+
+
+def get_host_os(db_path, default='windows'):
+    """Return the configured host OS, reading the database only once."""
+    value = _HOST_OS_CACHE['value']
+    if value is None:
+        value = get_setting(db_path, 'host_os', default) or default
+        _HOST_OS_CACHE['value'] = value
+    return value
+
+
+def invalidate_host_os_cache():
+    _HOST_OS_CACHE['value'] = None
+
+
+def get_settings_cached(db_path, keys, ttl=SETTINGS_CACHE_TTL):
+    """Like get_settings(), but reuses results for up to `ttl` seconds."""
+    cache_key = (db_path, tuple(keys))
+    now = time.monotonic()
+    with _settings_cache_lock:
+        cached = _settings_cache.get(cache_key)
+        if cached and now - cached[0] < ttl:
+            return dict(cached[1])
+    values = get_settings(db_path, keys)
+    with _settings_cache_lock:
+        _settings_cache[cache_key] = (now, values)
+    return dict(values)
+
+
+def invalidate_settings_cache():
+    with _settings_cache_lock:
+        _settings_cache.clear()
+    invalidate_host_os_cache()